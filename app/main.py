@@ -1,54 +0,0 @@
-"""
-Main application module for Watchdog AI backend.
-"""
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-import os
-import logging
-
-from app.api.routes import router as api_router
-from app.core.config import settings
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger("watchdog")
-
-# Create FastAPI app
-app = FastAPI(
-    title="Watchdog AI",
-    description="API for dealership data analysis and insights",
-    version="1.0.0",
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include API routes
-app.include_router(api_router, prefix="/v1")
-
-# Mount static files directory for charts and other generated content
-os.makedirs(settings.STATIC_DIR, exist_ok=True)
-app.mount("/static", StaticFiles(directory=settings.STATIC_DIR), name="static")
-
-@app.get("/")
-async def root():
-    """Root endpoint that returns API information."""
-    return {
-        "name": "Watchdog AI API",
-        "version": "1.0.0",
-        "status": "operational"
-    }
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,58 +1,119 @@
 """
 API models for request and response validation.
+
+Response models expose a ``build`` factory that skips validation. It is only
+safe for fields the server controls (upload metadata, chart URLs, insight items
+that were already validated); values derived from the uploaded data must still
+go through the regular constructor.
 """
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+class _Model(BaseModel):
+    """Base for all API models: closed, immutable, no assignment validation."""
+    # revalidate_instances='never' lets already-built models (e.g. InsightItems inside a
+    # response) pass through nested validation with an isinstance check only
+    model_config = ConfigDict(
+        extra='forbid',
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances='never',
+    )
 
 
-class UploadResponse(BaseModel):
+class UploadResponse(_Model):
     """Response model for file upload endpoint."""
     upload_id: str
     filename: str
     row_count: int
     column_count: int
 
+    @classmethod
+    def build(cls, **data: Any) -> "UploadResponse":
+        """Construct from trusted, server-generated data without validation."""
+        return cls.model_construct(**data)
 
-class AnalysisRequest(BaseModel):
-    """Request model for data analysis endpoint."""
-    intent: str = Field(
-        default="general_analysis",
-        description="Analysis intent (e.g., 'sales_analysis', 'profit_analysis')"
-    )
 
+class AnalysisRequest(_Model):
+    """
+    Request model for data analysis endpoint.
+
+    `intent` selects the analysis (e.g., 'sales_analysis', 'profit_analysis').
+    """
+    intent: str = "general_analysis"
 
-class InsightItem(BaseModel):
+
+class InsightItem(_Model):
     """Model for a single insight item."""
     title: str
     description: Optional[str] = None
     employee: Optional[str] = None
     employeeTitle: Optional[str] = None
     amount: Optional[str] = None
-    percentage: Optional[Union[str, float]] = None
+    percentage: Optional[str] = None
     actionItems: Optional[List[str]] = None
 
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> Tuple["InsightItem", ...]:
+        """Validate a batch of insight dicts in a single pydantic-core call."""
+        return _INSIGHTS_ADAPTER.validate_python(records)
+
 
-class AnalysisResponse(BaseModel):
+class AnalysisResponse(_Model):
     """Response model for data analysis endpoint."""
-    insights: List[InsightItem]
+    insights: Tuple[InsightItem, ...]
     chart_url: Optional[str] = None
     html: Optional[str] = None
 
+    @classmethod
+    def build(cls, **data: Any) -> "AnalysisResponse":
+        """Construct from trusted, server-generated data without validation."""
+        return cls.model_construct(**data)
 
-class QuestionRequest(BaseModel):
+
+class QuestionRequest(_Model):
     """Request model for question answering endpoint."""
     question: str
 
 
-class QuestionResponse(BaseModel):
+class QuestionResponse(_Model):
     """Response model for question answering endpoint."""
     answer: str
-    insights: List[InsightItem]
+    insights: Tuple[InsightItem, ...]
     chart_url: Optional[str] = None
 
+    @classmethod
+    def build(cls, **data: Any) -> "QuestionResponse":
+        """Construct from trusted, server-generated data without validation."""
+        return cls.model_construct(**data)
+
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_Model):
     """Response model for error responses."""
+    # Only needed on failure paths, so the schema is built on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     detail: str
     code: Optional[str] = None
-    params: Optional[Dict[str, Any]] = None
+    # Parameters are JSON-encoded by the caller rather than validated as Dict[str, Any]
+    params_json: Optional[str] = None
+
+
+_INSIGHTS_ADAPTER = TypeAdapter(Tuple[InsightItem, ...])
+
+# Serializers are built once at import and reused for every response
+_ENCODERS = {
+    model: TypeAdapter(model).dump_json
+    for model in (UploadResponse, InsightItem, AnalysisResponse, QuestionResponse)
+}
+
+
+def dump_json(instance: BaseModel) -> bytes:
+    """Serialize an API model to JSON bytes with its cached encoder."""
+    model = type(instance)
+    encoder = _ENCODERS.get(model)
+    if encoder is None:
+        # Deferred models (ErrorResponse) get their encoder on first use
+        encoder = _ENCODERS[model] = TypeAdapter(model).dump_json
+    return encoder(instance)
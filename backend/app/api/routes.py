@@ -2,29 +2,68 @@
 API routes for the Watchdog AI application.
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+import asyncio
+import logging
 import uuid
 import os
-from typing import Optional
+from typing import Any, Optional
 
 from app.api.models import (
     UploadResponse, 
     AnalysisRequest, 
     AnalysisResponse, 
+    InsightItem,
     QuestionRequest, 
-    QuestionResponse
+    QuestionResponse,
+    dump_json
 )
-from app.services.data_loader import load_csv_file
+from app.services.data_loader import load_csv_file, load_processed_data, save_processed_data
 from app.services.data_cleaner import clean_data
 from app.services.analyzer import analyze_data
 from app.services.insight_engine import generate_insights, answer_question
 from app.services.chart_generator import generate_chart
 from app.core.config import settings
+from app.core.store import UploadStore
+from app.core.workers import get_executor
+
+logger = logging.getLogger("watchdog.routes")
 
 router = APIRouter()
 
+
+class ModelResponse(Response):
+    """JSON response rendered straight from an API model with its cached encoder."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+# Read size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Upload directory as a plain string, so path joins skip the Path.__fspath__ call
+UPLOAD_DIR = os.fspath(settings.UPLOAD_DIR)
+
 # In-memory storage for uploaded files (in production, use a database)
-uploads = {}
+uploads = UploadStore(maxsize=settings.MAX_UPLOADS, ttl=settings.SESSION_EXPIRY)
+
+# Recently analyzed DataFrames, so follow-up questions skip reloading the file
+frames = UploadStore(maxsize=settings.FRAME_CACHE_SIZE, ttl=settings.FRAME_CACHE_TTL)
+
+
+def get_processed_frame(upload_id: str, processed_path: str):
+    """
+    Return an upload's processed DataFrame, loading it if needed.
+    
+    The frame is shared between requests (analyze_data memoizes its results
+    on it), so it must not be modified.
+    """
+    df = frames.get(upload_id)
+    if df is None:
+        df = load_processed_data(processed_path)
+        frames.set(upload_id, df)
+    return df
 
 
 @router.post("/upload", response_model=UploadResponse)
@@ -39,55 +78,78 @@ async def upload_file(
     for use in subsequent analysis requests.
     """
     # Validate file type
-    if not file.filename.endswith(('.csv', '.CSV')):
+    if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
     
     # Generate unique ID for this upload
     upload_id = str(uuid.uuid4())
     
     # Create file path
-    file_path = os.path.join(settings.UPLOAD_DIR, f"{upload_id}.csv")
+    file_path = os.path.join(UPLOAD_DIR, f"{upload_id}.csv")
     
     try:
-        # Save file
+        # Save file in chunks so the whole body is never held in memory
+        size = 0
         with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=413, detail="File exceeds the maximum upload size")
+                f.write(chunk)
         
-        # Load and validate CSV
-        df = load_csv_file(file_path)
+        # Load and validate CSV (parsed in a worker thread so it doesn't block
+        # the event loop)
+        df = await asyncio.to_thread(load_csv_file, file_path)
         
         # Store metadata
-        uploads[upload_id] = {
+        uploads.set(upload_id, {
             "file_path": file_path,
             "original_filename": file.filename,
             "row_count": len(df),
             "column_count": len(df.columns),
             "processed": False
-        }
+        })
         
         # Process data in background
         background_tasks.add_task(process_uploaded_file, upload_id)
         
-        return UploadResponse(
+        response = UploadResponse.build(
             upload_id=upload_id,
             filename=file.filename,
             row_count=len(df),
             column_count=len(df.columns)
         )
+        # Returning a Response skips FastAPI's re-validation and jsonable_encoder pass
+        # (response_model is kept for the docs)
+        return ModelResponse(response)
     
     except Exception as e:
         # Clean up file if there was an error
         if os.path.exists(file_path):
             os.remove(file_path)
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
 
-def process_uploaded_file(upload_id: str):
+def clean_upload(file_path: str, processed_path: str) -> None:
+    """
+    Load, clean and save an uploaded file.
+    
+    Runs in a worker process, so it takes paths rather than reading the
+    in-memory upload store.
+    """
+    df = load_csv_file(file_path)
+    save_processed_data(clean_data(df), processed_path)
+
+
+async def process_uploaded_file(upload_id: str):
     """
     Process an uploaded file in the background.
     
-    This includes cleaning the data and preparing it for analysis.
+    This includes cleaning the data and preparing it for analysis. The
+    CPU-bound work runs in the worker process pool, and the upload metadata
+    is updated here once it finishes.
     """
     try:
         # Get file info
@@ -95,23 +157,19 @@ def process_uploaded_file(upload_id: str):
         if not file_info:
             return
         
-        # Load data
-        df = load_csv_file(file_info["file_path"])
-        
-        # Clean data
-        cleaned_df = clean_data(df)
-        
-        # Save processed data
-        processed_path = os.path.join(settings.UPLOAD_DIR, f"{upload_id}_processed.csv")
-        cleaned_df.to_csv(processed_path, index=False)
+        # Clean and save processed data in a worker process
+        processed_path = os.path.join(UPLOAD_DIR, f"{upload_id}_processed.pkl")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            get_executor(), clean_upload, file_info["file_path"], processed_path
+        )
         
         # Update metadata
-        uploads[upload_id]["processed"] = True
-        uploads[upload_id]["processed_path"] = processed_path
+        uploads.update(upload_id, processed=True, processed_path=processed_path)
     
     except Exception as e:
         # Log error but don't raise exception (background task)
-        print(f"Error processing file {upload_id}: {str(e)}")
+        logger.error("Error processing file %s: %s", upload_id, e)
 
 
 @router.post("/analyze/{upload_id}", response_model=AnalysisResponse)
@@ -125,19 +183,17 @@ async def analyze(
     Returns insights and optionally a chart URL.
     """
     # Check if upload exists
-    if upload_id not in uploads:
+    file_info = uploads.get(upload_id)
+    if file_info is None:
         raise HTTPException(status_code=404, detail="Upload not found")
     
-    # Get file info
-    file_info = uploads[upload_id]
-    
     # Check if file has been processed
     if not file_info.get("processed", False):
         raise HTTPException(status_code=400, detail="File is still being processed")
     
     try:
         # Load processed data
-        df = load_csv_file(file_info["processed_path"])
+        df = get_processed_frame(upload_id, file_info["processed_path"])
         
         # Analyze data based on intent
         analysis_results = analyze_data(df, request.intent)
@@ -145,20 +201,21 @@ async def analyze(
         # Generate insights
         insights = generate_insights(analysis_results, request.intent)
         
-        # Generate chart if needed
+        # Generate chart if needed (rendered in a worker thread so it doesn't
+        # block the event loop)
         chart_url = None
         if analysis_results.get("chart_data"):
-            chart_filename = f"{upload_id}_{request.intent}.png"
-            chart_url = generate_chart(
+            chart_url = await asyncio.to_thread(
+                generate_chart,
                 analysis_results["chart_data"],
-                chart_filename,
                 chart_type=analysis_results.get("chart_type", "bar")
             )
         
-        return AnalysisResponse(
-            insights=insights,
+        response = AnalysisResponse.build(
+            insights=InsightItem.from_records(insights),
             chart_url=chart_url
         )
+        return ModelResponse(response)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing data: {str(e)}")
@@ -175,38 +232,37 @@ async def ask_question(
     Returns an answer, insights, and optionally a chart URL.
     """
     # Check if upload exists
-    if upload_id not in uploads:
+    file_info = uploads.get(upload_id)
+    if file_info is None:
         raise HTTPException(status_code=404, detail="Upload not found")
     
-    # Get file info
-    file_info = uploads[upload_id]
-    
     # Check if file has been processed
     if not file_info.get("processed", False):
         raise HTTPException(status_code=400, detail="File is still being processed")
     
     try:
         # Load processed data
-        df = load_csv_file(file_info["processed_path"])
+        df = get_processed_frame(upload_id, file_info["processed_path"])
         
         # Process question and generate answer
         answer_data = answer_question(df, request.question)
         
-        # Generate chart if needed
+        # Generate chart if needed (rendered in a worker thread so it doesn't
+        # block the event loop)
         chart_url = None
         if answer_data.get("chart_data"):
-            chart_filename = f"{upload_id}_question_{uuid.uuid4().hex[:8]}.png"
-            chart_url = generate_chart(
+            chart_url = await asyncio.to_thread(
+                generate_chart,
                 answer_data["chart_data"],
-                chart_filename,
                 chart_type=answer_data.get("chart_type", "bar")
             )
         
-        return QuestionResponse(
+        response = QuestionResponse.build(
             answer=answer_data["answer"],
-            insights=answer_data["insights"],
+            insights=InsightItem.from_records(answer_data["insights"]),
             chart_url=chart_url
         )
+        return ModelResponse(response)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
@@ -3,7 +3,7 @@ Configuration settings for the Watchdog AI application.
 """
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -24,12 +24,19 @@ class Settings(BaseSettings):
     UPLOAD_DIR: Path = BASE_DIR / "data" / "uploads"
     STATIC_DIR: Path = BASE_DIR / "data" / "static"
     CHARTS_DIR: Path = BASE_DIR / "data" / "static" / "charts"
+    MAX_CHARTS: int = 256  # chart images kept on disk (least recently used are deleted)
     
     # File size limits (in bytes)
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10 MB
     
     # Session settings
     SESSION_EXPIRY: int = 60 * 60 * 24  # 24 hours
+    MAX_UPLOADS: int = 1024  # upload metadata entries kept in memory
+    FRAME_CACHE_SIZE: int = 16  # processed DataFrames kept in memory
+    FRAME_CACHE_TTL: int = 5 * 60  # 5 minutes
+    
+    # Worker processes for cleaning uploads (None uses one per CPU)
+    PROCESS_WORKERS: Optional[int] = None
     
     # Logging settings
     LOG_LEVEL: str = "INFO"
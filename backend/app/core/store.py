@@ -0,0 +1,66 @@
+"""
+In-memory per-upload stores for the Watchdog AI application.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class UploadStore:
+    """
+    Bounded, thread-safe store of per-upload values, such as upload metadata
+    or loaded DataFrames.
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted once `maxsize` is reached. Request handlers and background tasks
+    (which run in a worker thread) share one lock.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        # Drop expired entries from the least recently used end; any others that
+        # have expired are dropped by their next lookup
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
+
+    def get(self, upload_id: str) -> Optional[Any]:
+        """Return the value for an upload, or None if unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(upload_id)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[upload_id]
+                return None
+            self._entries.move_to_end(upload_id)
+            return entry[1]
+
+    def set(self, upload_id: str, value: Any) -> None:
+        """Store a value for an upload, evicting old entries as needed."""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[upload_id] = (now + self.ttl, value)
+            self._entries.move_to_end(upload_id)
+            self._expire(now)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def update(self, upload_id: str, **fields: Any) -> None:
+        """Merge fields into an upload's metadata dict, if it is still stored."""
+        with self._lock:
+            entry = self._entries.get(upload_id)
+            if entry is not None:
+                entry[1].update(fields)
+
+    def __contains__(self, upload_id: str) -> bool:
+        return self.get(upload_id) is not None
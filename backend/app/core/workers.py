@@ -0,0 +1,30 @@
+"""
+Worker process pool for CPU-bound processing in the Watchdog AI application.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use.
+
+    pandas cleaning holds the GIL, so uploads are processed in separate
+    processes to let concurrent uploads use more than one core.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.PROCESS_WORKERS)
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the process pool if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
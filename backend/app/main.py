@@ -1,14 +1,16 @@
 """
 Main application module for Watchdog AI backend.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-import os
 import logging
 
 from app.api.routes import router as api_router
 from app.core.config import settings
+from app.core.workers import shutdown_executor
 
 # Configure logging
 logging.basicConfig(
@@ -17,11 +19,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger("watchdog")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop the upload worker processes when the app shuts down."""
+    yield
+    shutdown_executor()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Watchdog AI",
     description="API for dealership data analysis and insights",
     version="1.0.0",
+    lifespan=lifespan,
 )  # type: ignore
 # Add global exception handlers to ensure all errors (including Pydantic validation) are logged with tracebacks
 from fastapi.exceptions import RequestValidationError
@@ -30,12 +41,12 @@ from fastapi.responses import JSONResponse
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):  # noqa: F811
-    logger.exception(f"Request validation error: {exc}")
+    logger.exception("Request validation error: %s", exc)
     return JSONResponse(status_code=422, content={"detail": exc.errors()})
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):  # noqa: F811
-    logger.exception(f"Unhandled exception: {exc}")
+    logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(status_code=500, content={"detail": str(exc)})
 
 # Configure CORS
@@ -51,7 +62,7 @@ app.add_middleware(
 app.include_router(api_router, prefix="/v1")
 
 # Mount static files directory for charts and other generated content
-os.makedirs(settings.STATIC_DIR, exist_ok=True)
+# (created by app.core.config on import)
 app.mount("/static", StaticFiles(directory=settings.STATIC_DIR), name="static")
 
 @app.get("/")
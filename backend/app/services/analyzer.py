@@ -6,15 +6,218 @@ This module handles analyzing dealership data to extract insights.
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import weakref
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger("watchdog.analyzer")
 
+# Substrings that identify each column role (matched against lowercased names)
+_COLUMN_TERMS = {
+    "price": ['sold_price', 'selling_price', 'sale_price'],
+    "profit": ['profit'],
+    "rep": ['sales_rep', 'salesperson', 'rep_name'],
+    "source": ['lead_source', 'source'],
+    "make": ['make', 'vehicle_make'],
+    "model": ['model', 'vehicle_model'],
+    "expense": ['expense', 'cost'],
+    "days": ['days_to_close', 'days_to_sell'],
+    "date": ['date'],
+}
+
+# One case-insensitive pattern per role, matching any of its terms
+_COLUMN_PATTERNS = {
+    role: re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+    for role, terms in _COLUMN_TERMS.items()
+}
+
+@lru_cache(maxsize=128)
+def _resolve_columns(columns: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Match every column against every role in one pass over the names."""
+    matches = {role: [] for role in _COLUMN_PATTERNS}
+    for col in columns:
+        for role, pattern in _COLUMN_PATTERNS.items():
+            if pattern.search(col):
+                matches[role].append(col)
+    return {role: tuple(cols) for role, cols in matches.items()}
+
+def find_columns(df: pd.DataFrame, role: str) -> Tuple[str, ...]:
+    """
+    Get the columns of a DataFrame that match a role, in column order.
+    
+    Resolved roles are cached by the column names, so the helpers below share
+    one scan per distinct set of columns instead of each rescanning df.columns.
+    """
+    return _resolve_columns(tuple(df.columns))[role]
+
+# Per-group aggregates computed by _group_stats for each value column role
+_GROUP_AGGREGATES = {
+    "profit": [("total_profit", "sum"), ("average_profit", "mean"),
+               ("highest_profit", "max"), ("profit_count", "count")],
+    "price": [("total_sales", "sum"), ("average_sale", "mean"), ("highest_sale", "max")],
+    "expense": [("total_expense", "sum"), ("average_expense", "mean")],
+    "days": [("average_days_to_sell", "mean")],
+}
+
+# Values derived from a DataFrame, keyed by id() of that DataFrame; entries are
+# dropped when the DataFrame is garbage collected
+_FRAME_CACHES: Dict[int, Dict[Tuple[str, ...], Any]] = {}
+
+def _frame_cache(df: pd.DataFrame) -> Dict[Tuple[str, ...], Any]:
+    """Get the cache of values derived from a DataFrame."""
+    cache = _FRAME_CACHES.get(id(df))
+    if cache is None:
+        cache = _FRAME_CACHES[id(df)] = {}
+        weakref.finalize(df, _FRAME_CACHES.pop, id(df), None)
+    return cache
+
+# Roles whose columns are grouped on, and the most distinct values per row for
+# which converting them to categoricals pays off
+_CATEGORY_ROLES = ("rep", "source", "make", "model")
+_CATEGORY_MAX_RATIO = 0.5
+
+def _analysis_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get the frame the analysis helpers work on for a DataFrame.
+    
+    This is a shallow copy, built once per DataFrame and shared by every
+    intent, in which low-cardinality grouping columns are categoricals: the
+    helpers group on them repeatedly, and groupby on integer codes skips
+    hashing every string again. Columns with missing values are left alone,
+    since a categorical would turn None into NaN in the rows the helpers
+    return (cleaned uploads have none). The helpers add derived columns to
+    it; the caller's frame is never modified.
+    """
+    cache = _frame_cache(df)
+    frame = cache.get(("analysis_frame",))
+    if frame is None:
+        frame = df.copy(deep=False)
+        for role in _CATEGORY_ROLES:
+            for col in find_columns(frame, role)[:1]:
+                values = frame[col]
+                if (values.dtype == object and not values.hasnans
+                        and values.nunique() < _CATEGORY_MAX_RATIO * len(values)):
+                    frame[col] = values.astype("category")
+        cache[("analysis_frame",)] = frame
+    return frame
+
+def _text_column(series: pd.Series) -> pd.Series:
+    """Get a grouping column as plain objects, undoing the categorical conversion of _analysis_frame."""
+    return series.astype(object) if isinstance(series.dtype, pd.CategoricalDtype) else series
+
+def _group_stats(df: pd.DataFrame, group_col: Union[str, List[str]]) -> pd.DataFrame:
+    """
+    Aggregate the profit, price, expense and days columns by a grouping column
+    (or a list of columns, grouping on their combinations).
+    
+    All aggregates come from a single groupby pass and are cached for the
+    lifetime of the DataFrame, so the helpers that rank or summarize the same
+    groups share one computation. The result is indexed by group value (sorted,
+    missing values dropped) and has a sale_count column plus the
+    _GROUP_AGGREGATES columns for each value column found.
+    """
+    value_cols = {role: cols[0] for role in _GROUP_AGGREGATES if (cols := find_columns(df, role))}
+    group_key = tuple(group_col) if isinstance(group_col, list) else group_col
+    key = ("group_stats", group_key, *value_cols.values())
+    cache = _frame_cache(df)
+    if key in cache:
+        return cache[key]
+    
+    grouped = df.groupby(group_col, observed=True)
+    aggregations = {
+        name: (value_cols[role], func)
+        for role, aggregates in _GROUP_AGGREGATES.items() if role in value_cols
+        for name, func in aggregates
+    }
+    stats = grouped.agg(**aggregations) if aggregations else pd.DataFrame(index=grouped.size().index)
+    stats.insert(0, "sale_count", grouped.size())
+    
+    cache[key] = stats
+    return stats
+
+def _group_records(
+    df: pd.DataFrame,
+    group_col: str,
+    name_key: str,
+    columns: List[str],
+    sort_by: str,
+    rename: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get per-group metrics from _group_stats as a list of dictionaries.
+    
+    Each record holds the group under name_key followed by the given columns
+    (renamed by rename, if given), and records are sorted by sort_by descending
+    (ties keep group order). Count columns stay integers; the rest are floats.
+    Groups over several columns are named by their values joined with spaces.
+    """
+    stats = _group_stats(df, group_col)[columns]
+    stats = stats.astype({col: float for col in columns if not col.endswith("_count")})
+    stats = stats.sort_values(sort_by, ascending=False, kind="stable")
+    if rename:
+        stats = stats.rename(columns=rename)
+    return _records(stats, name_key)
+
+def _records(stats: pd.DataFrame, name_key: str) -> List[Dict[str, Any]]:
+    """Convert per-group stats to a list of dictionaries, with the group under name_key."""
+    names = stats.index
+    if isinstance(names, pd.MultiIndex):
+        names = [" ".join(map(str, values)) for values in names]
+    return [
+        {name_key: name, **record}
+        for name, record in zip(names, stats.to_dict("records"))
+    ]
+
+def _metrics_sort_column(df: pd.DataFrame) -> str:
+    """Get the column detailed metrics are ranked by: total profit, else total sales, else sale count."""
+    if find_columns(df, "profit"):
+        return "total_profit"
+    if find_columns(df, "price"):
+        return "total_sales"
+    return "sale_count"
+
+def _add_ratio(
+    records: List[Dict[str, Any]], key: str, numerator: str, denominator: str
+) -> List[Dict[str, Any]]:
+    """Add numerator / denominator as a percentage to each record with a positive denominator."""
+    for record in records:
+        if record[denominator] > 0:
+            record[key] = (record[numerator] / record[denominator]) * 100
+    return records
+
+def _roi(stats: pd.DataFrame) -> np.ndarray:
+    """Get total profit / total expense as a percentage per group (0 where there is no expense)."""
+    profit = stats["total_profit"].to_numpy(dtype=float)
+    expense = stats["total_expense"].to_numpy(dtype=float)
+    roi = np.divide(profit, expense, out=np.zeros_like(profit), where=expense > 0)
+    return roi * 100
+
+def _top_group(df: pd.DataFrame, group_col: Union[str, List[str]]) -> Optional[Dict[str, Any]]:
+    """Get the group with the highest total profit from _group_stats."""
+    stats = _group_stats(df, group_col)
+    if len(stats) == 0:
+        return None
+    
+    # Positional argmax on the raw arrays (first maximum, like idxmax) avoids
+    # label lookups on the aggregate frame
+    totals = stats["total_profit"].to_numpy()
+    top = totals.argmax()
+    return {
+        "name": stats.index[top],
+        "total_profit": float(totals[top]),
+        "sale_count": int(stats["sale_count"].to_numpy()[top])
+    }
+
 def analyze_data(df: pd.DataFrame, intent: str = "general_analysis") -> Dict[str, Any]:
     """
     Analyze data based on the specified intent.
     
+    Results are memoized per DataFrame and intent, so repeated analyses of the
+    same frame are a lookup; callers share the returned dictionary and must
+    not modify it. The DataFrame itself is left unchanged.
+    
     Args:
         df: DataFrame to analyze
         intent: Analysis intent (e.g., 'sales_analysis', 'profit_analysis')
@@ -22,22 +225,20 @@ def analyze_data(df: pd.DataFrame, intent: str = "general_analysis") -> Dict[str
     Returns:
         Dictionary containing analysis results
     """
-    logger.info(f"Analyzing data with intent: {intent}")
-    
-    # Determine which analysis to run based on intent
-    if intent == "sales_analysis":
-        return analyze_sales(df)
-    elif intent == "profit_analysis":
-        return analyze_profit(df)
-    elif intent == "rep_performance":
-        return analyze_rep_performance(df)
-    elif intent == "lead_source_analysis":
-        return analyze_lead_sources(df)
-    elif intent == "vehicle_analysis":
-        return analyze_vehicles(df)
-    else:
-        # Default to general analysis
-        return analyze_general(df)
+    cache = _frame_cache(df)
+    key = ("analysis", intent)
+    if key in cache:
+        return cache[key]
+    
+    logger.info("Analyzing data with intent: %s", intent)
+    
+    frame = _analysis_frame(df)
+    
+    # Determine which analysis to run based on intent (default to general analysis)
+    results = _ANALYZERS.get(intent, analyze_general)(frame)
+    
+    cache[key] = results
+    return results
 
 def analyze_general(df: pd.DataFrame) -> Dict[str, Any]:
     """
@@ -114,7 +315,7 @@ def analyze_sales(df: pd.DataFrame) -> Dict[str, Any]:
             "lowest_sale": get_lowest_sale(df)
         },
         "sales_by_rep": get_sales_by_rep(df),
-        "sales_by_month": get_sales_by_month(df) if has_date_column(df) else None,
+        "sales_by_month": get_sales_by_month(df),
         "sales_by_vehicle_type": get_sales_by_vehicle_type(df)
     }
     
@@ -188,6 +389,7 @@ def analyze_lead_sources(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary containing analysis results
     """
+    source_roi = get_lead_source_roi(df)
     results = {
         "summary": {
             "total_sources": get_total_lead_sources(df),
@@ -195,7 +397,9 @@ def analyze_lead_sources(df: pd.DataFrame) -> Dict[str, Any]:
             "average_profit_per_source": get_average_profit_per_source(df)
         },
         "source_metrics": get_lead_source_metrics(df),
-        "source_roi": get_lead_source_roi(df)
+        "source_roi": source_roi,
+        # source_roi is sorted by ROI descending, so the best source is first
+        "top_roi": source_roi[0] if source_roi else {}
     }
     
     # Add chart data
@@ -214,6 +418,7 @@ def analyze_vehicles(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary containing analysis results
     """
+    vehicle_metrics = get_vehicle_metrics(df)
     results = {
         "summary": {
             "total_vehicles": len(df),
@@ -221,7 +426,12 @@ def analyze_vehicles(df: pd.DataFrame) -> Dict[str, Any]:
             "top_model": get_top_vehicle_model(df),
             "average_days_to_sell": get_average_days_to_sell(df)
         },
-        "vehicle_metrics": get_vehicle_metrics(df),
+        "vehicle_metrics": vehicle_metrics,
+        "fastest_vehicle": min(
+            vehicle_metrics,
+            key=lambda x: x.get("average_days_to_sell", float('inf')),
+            default={}
+        ),
         "make_performance": get_make_performance(df),
         "model_performance": get_model_performance(df)
     }
@@ -232,18 +442,75 @@ def analyze_vehicles(df: pd.DataFrame) -> Dict[str, Any]:
     
     return results
 
+# Analysis to run for each intent; other intents get the general analysis
+_ANALYZERS = {
+    "sales_analysis": analyze_sales,
+    "profit_analysis": analyze_profit,
+    "rep_performance": analyze_rep_performance,
+    "lead_source_analysis": analyze_lead_sources,
+    "vehicle_analysis": analyze_vehicles,
+}
+
 # Helper functions for data extraction
 
+def _parsed_dates(df: pd.DataFrame, date_col: str) -> pd.Series:
+    """Parse a date column, once per DataFrame (unparseable values become NaT)."""
+    cache = _frame_cache(df)
+    key = ("dates", date_col)
+    if key not in cache:
+        cache[key] = pd.to_datetime(df[date_col], errors='coerce')
+    return cache[key]
+
+def _column_summary(df: pd.DataFrame, col: str) -> Dict[str, Any]:
+    """
+    Get the sum, mean and row positions of the maximum and minimum of a numeric
+    column, computed once per DataFrame.
+    
+    The totals, averages, margin and highest/lowest sale helpers all read the
+    same price and profit columns, so they share these reductions. The row
+    positions are None when the column has no values.
+    
+    Float and integer columns are reduced on the underlying numpy array, which
+    skips the per-call Series overhead; other dtypes stay on pandas.
+    """
+    cache = _frame_cache(df)
+    key = ("summary", col)
+    if key in cache:
+        return cache[key]
+    
+    column = df[col]
+    values = column.to_numpy()
+    if values.dtype.kind in "fi":
+        has_values = len(values) > 0 and not np.isnan(values).all()
+        summary = {
+            "sum": np.nansum(values),
+            "mean": np.nanmean(values) if has_values else np.nan,
+            "argmax": int(np.nanargmax(values)) if has_values else None,
+            "argmin": int(np.nanargmin(values)) if has_values else None
+        }
+    else:
+        has_values = bool(column.notna().any())
+        positions = column.reset_index(drop=True)
+        summary = {
+            "sum": column.sum(),
+            "mean": column.mean(),
+            "argmax": positions.idxmax() if has_values else None,
+            "argmin": positions.idxmin() if has_values else None
+        }
+    
+    cache[key] = summary
+    return summary
+
 def get_date_range(df: pd.DataFrame) -> Optional[Dict[str, str]]:
     """Get the date range of the data if date columns exist."""
-    date_columns = [col for col in df.columns if 'date' in col.lower()]
+    date_columns = find_columns(df, "date")
     if not date_columns:
         return None
     
     # Use the first date column found
     date_col = date_columns[0]
     try:
-        dates = pd.to_datetime(df[date_col], errors='coerce')
+        dates = _parsed_dates(df, date_col)
         min_date = dates.min()
         max_date = dates.max()
         if pd.isna(min_date) or pd.isna(max_date):
@@ -259,216 +526,140 @@ def get_date_range(df: pd.DataFrame) -> Optional[Dict[str, str]]:
 def get_total_sales(df: pd.DataFrame) -> float:
     """Get the total sales amount."""
     # Look for sold_price or similar columns
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    price_cols = find_columns(df, "price")
     if not price_cols:
         return 0.0
     
     # Use the first price column found
     price_col = price_cols[0]
-    return df[price_col].sum()
+    return _column_summary(df, price_col)["sum"]
 
 def get_total_profit(df: pd.DataFrame) -> float:
     """Get the total profit amount."""
     # Look for profit or similar columns
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    profit_cols = find_columns(df, "profit")
     if not profit_cols:
         return 0.0
     
     # Use the first profit column found
     profit_col = profit_cols[0]
-    return df[profit_col].sum()
+    return _column_summary(df, profit_col)["sum"]
 
 def get_average_profit(df: pd.DataFrame) -> float:
     """Get the average profit per sale."""
     # Look for profit or similar columns
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    profit_cols = find_columns(df, "profit")
     if not profit_cols:
         return 0.0
     
     # Use the first profit column found
     profit_col = profit_cols[0]
-    return df[profit_col].mean()
+    return _column_summary(df, profit_col)["mean"]
 
 def get_top_sales_rep(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the top performing sales representative by profit."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep and sum profit
-    rep_profit = df.groupby(rep_col)[profit_col].sum().reset_index()
-    
-    # Get the top rep
-    if len(rep_profit) == 0:
-        return None
-    
-    top_rep = rep_profit.loc[rep_profit[profit_col].idxmax()]
-    return {
-        "name": top_rep[rep_col],
-        "total_profit": float(top_rep[profit_col]),
-        "sale_count": int(df[df[rep_col] == top_rep[rep_col]].shape[0])
-    }
+    # Get the sales rep with the highest total profit
+    return _top_group(df, rep_cols[0])
 
 def get_top_lead_source(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the top performing lead source by profit."""
     # Look for lead source and profit columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
     
     if not source_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    source_col = source_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by lead source and sum profit
-    source_profit = df.groupby(source_col)[profit_col].sum().reset_index()
-    
-    # Get the top source
-    if len(source_profit) == 0:
-        return None
-    
-    top_source = source_profit.loc[source_profit[profit_col].idxmax()]
-    return {
-        "name": top_source[source_col],
-        "total_profit": float(top_source[profit_col]),
-        "sale_count": int(df[df[source_col] == top_source[source_col]].shape[0])
-    }
+    # Get the lead source with the highest total profit
+    return _top_group(df, source_cols[0])
 
 def get_top_vehicle(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the top performing vehicle by profit."""
     # Look for vehicle model and profit columns
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    model_cols = find_columns(df, "model")
+    make_cols = find_columns(df, "make")
+    profit_cols = find_columns(df, "profit")
     
     if not model_cols or not profit_cols:
         return None
     
-    # Use the first columns found
+    # Use the first model column found
     model_col = model_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Include make if available
-    if make_cols:
-        make_col = make_cols[0]
-        df['full_vehicle'] = df[make_col] + ' ' + df[model_col]
-        group_col = 'full_vehicle'
-    else:
-        group_col = model_col
-    
-    # Group by vehicle and sum profit
-    vehicle_profit = df.groupby(group_col)[profit_col].sum().reset_index()
-    
-    # Get the top vehicle
-    if len(vehicle_profit) == 0:
-        return None
     
-    top_vehicle = vehicle_profit.loc[vehicle_profit[profit_col].idxmax()]
-    return {
-        "name": top_vehicle[group_col],
-        "total_profit": float(top_vehicle[profit_col]),
-        "sale_count": int(df[df[group_col] == top_vehicle[group_col]].shape[0])
-    }
+    # Without a make, get the model with the highest total profit
+    if not make_cols:
+        return _top_group(df, model_col)
+    
+    # Group on make and model together rather than building a concatenated
+    # column, then name the top pair "make model"
+    top_vehicle = _top_group(df, [make_cols[0], model_col])
+    if top_vehicle is not None:
+        make, model = top_vehicle["name"]
+        top_vehicle["name"] = f"{make} {model}"
+    return top_vehicle
 
 def get_profit_by_rep_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Get chart data for profit by sales representative."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return {"labels": [], "datasets": [{"label": "Profit", "data": []}]}
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep and sum profit
-    rep_profit = df.groupby(rep_col)[profit_col].sum().reset_index()
-    
-    # Sort by profit descending
-    rep_profit = rep_profit.sort_values(profit_col, ascending=False)
-    
-    # Limit to top 10 reps
-    rep_profit = rep_profit.head(10)
+    # Top 10 reps by total profit (nlargest skips sorting every rep)
+    rep_profit = _group_stats(df, rep_cols[0])["total_profit"].nlargest(10)
     
     return {
-        "labels": rep_profit[rep_col].tolist(),
+        "labels": rep_profit.index.tolist(),
         "datasets": [{
             "label": "Profit",
-            "data": rep_profit[profit_col].tolist()
+            "data": rep_profit.tolist()
         }]
     }
 
 def get_sales_by_rep(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get sales metrics by sales representative."""
     # Look for sales rep, price, and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    price_cols = find_columns(df, "price")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols:
         return []
     
-    # Use the first rep column found
-    rep_col = rep_cols[0]
-    
-    # Group by sales rep
-    result = []
-    for rep, group in df.groupby(rep_col):
-        rep_data = {
-            "name": rep,
-            "sale_count": len(group)
-        }
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            rep_data["total_sales"] = float(group[price_col].sum())
-            rep_data["average_sale"] = float(group[price_col].mean())
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            rep_data["total_profit"] = float(group[profit_col].sum())
-            rep_data["average_profit"] = float(group[profit_col].mean())
-        
-        result.append(rep_data)
-    
-    # Sort by total profit or sales descending
+    # Include price and profit metrics if available
+    columns = ["sale_count"]
+    if price_cols:
+        columns += ["total_sales", "average_sale"]
     if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+        columns += ["total_profit", "average_profit"]
     
-    return result
+    # Sort by total profit or sales descending
+    return _group_records(df, rep_cols[0], "name", columns, _metrics_sort_column(df))
 
 def get_average_sale_price(df: pd.DataFrame) -> float:
     """Get the average sale price."""
     # Look for price columns
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    price_cols = find_columns(df, "price")
     if not price_cols:
         return 0.0
     
     # Use the first price column found
     price_col = price_cols[0]
-    return df[price_col].mean()
+    return _column_summary(df, price_col)["mean"]
 
 def get_highest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the highest sale."""
     # Look for price columns
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    price_cols = find_columns(df, "price")
     if not price_cols:
         return None
     
@@ -476,11 +667,11 @@ def get_highest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     price_col = price_cols[0]
     
     # Get the row with the highest price
-    if len(df) == 0:
+    highest_pos = _column_summary(df, price_col)["argmax"]
+    if highest_pos is None:
         return None
     
-    highest_idx = df[price_col].idxmax()
-    highest_row = df.loc[highest_idx]
+    highest_row = df.iloc[highest_pos]
     
     result = {
         "price": float(highest_row[price_col])
@@ -493,7 +684,7 @@ def get_highest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
             result[col] = highest_row[col]
     
     # Add sales rep if available
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
+    rep_cols = find_columns(df, "rep")
     if rep_cols:
         result["sales_rep"] = highest_row[rep_cols[0]]
     
@@ -502,7 +693,7 @@ def get_highest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
 def get_lowest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the lowest sale."""
     # Look for price columns
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    price_cols = find_columns(df, "price")
     if not price_cols:
         return None
     
@@ -510,11 +701,11 @@ def get_lowest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     price_col = price_cols[0]
     
     # Get the row with the lowest price
-    if len(df) == 0:
+    lowest_pos = _column_summary(df, price_col)["argmin"]
+    if lowest_pos is None:
         return None
     
-    lowest_idx = df[price_col].idxmin()
-    lowest_row = df.loc[lowest_idx]
+    lowest_row = df.iloc[lowest_pos]
     
     result = {
         "price": float(lowest_row[price_col])
@@ -527,22 +718,17 @@ def get_lowest_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
             result[col] = lowest_row[col]
     
     # Add sales rep if available
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
+    rep_cols = find_columns(df, "rep")
     if rep_cols:
         result["sales_rep"] = lowest_row[rep_cols[0]]
     
     return result
 
-def has_date_column(df: pd.DataFrame) -> bool:
-    """Check if the DataFrame has a date column."""
-    date_columns = [col for col in df.columns if 'date' in col.lower()]
-    return len(date_columns) > 0
-
 def get_sales_by_month(df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
     """Get sales metrics by month."""
     # Look for date and price columns
-    date_columns = [col for col in df.columns if 'date' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    date_columns = find_columns(df, "date")
+    price_cols = find_columns(df, "price")
     
     if not date_columns or not price_cols:
         return None
@@ -552,34 +738,27 @@ def get_sales_by_month(df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
     price_col = price_cols[0]
     
     try:
-        # Convert to datetime
-        df['date'] = pd.to_datetime(df[date_col], errors='coerce')
-        
-        # Extract month and year
-        df['month_year'] = df['date'].dt.strftime('%Y-%m')
-        
-        # Group by month and calculate metrics
-        monthly_sales = df.groupby('month_year').agg({
-            price_col: ['sum', 'mean', 'count']
-        }).reset_index()
-        
-        # Flatten the column names
-        monthly_sales.columns = ['month_year', 'total_sales', 'average_sale', 'sale_count']
-        
-        # Convert to list of dictionaries
-        result = []
-        for _, row in monthly_sales.iterrows():
-            result.append({
-                "month": row['month_year'],
-                "total_sales": float(row['total_sales']),
-                "average_sale": float(row['average_sale']),
-                "sale_count": int(row['sale_count'])
-            })
+        # Reduce the parsed dates to monthly periods (no per-row string formatting)
+        months = _parsed_dates(df, date_col).dt.to_period('M').rename('month_year')
         
-        # Sort by month
-        result.sort(key=lambda x: x["month"])
+        # Group by month (in month order) and calculate metrics
+        monthly_sales = df.groupby(months)[price_col].agg(['sum', 'mean', 'count'])
         
-        return result
+        # Format only the month labels and convert to list of dictionaries
+        return [
+            {
+                "month": month,
+                "total_sales": float(total_sales),
+                "average_sale": float(average_sale),
+                "sale_count": int(sale_count)
+            }
+            for month, total_sales, average_sale, sale_count in zip(
+                monthly_sales.index.strftime('%Y-%m'),
+                monthly_sales['sum'],
+                monthly_sales['mean'],
+                monthly_sales['count']
+            )
+        ]
     
     except:
         return None
@@ -587,16 +766,13 @@ def get_sales_by_month(df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
 def get_sales_by_vehicle_type(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get sales metrics by vehicle type."""
     # Look for vehicle make/model and price columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    make_cols = find_columns(df, "make")
+    model_cols = find_columns(df, "model")
+    price_cols = find_columns(df, "price")
     
     if not price_cols:
         return []
     
-    # Use the first price column found
-    price_col = price_cols[0]
-    
     # Group by make if available, otherwise use model if available
     if make_cols:
         group_col = make_cols[0]
@@ -605,57 +781,35 @@ def get_sales_by_vehicle_type(df: pd.DataFrame) -> List[Dict[str, Any]]:
     else:
         return []
     
-    # Group by vehicle type
-    result = []
-    for vehicle_type, group in df.groupby(group_col):
-        vehicle_data = {
-            "type": vehicle_type,
-            "sale_count": len(group),
-            "total_sales": float(group[price_col].sum()),
-            "average_sale": float(group[price_col].mean())
-        }
-        
-        result.append(vehicle_data)
-    
     # Sort by total sales descending
-    result.sort(key=lambda x: x["total_sales"], reverse=True)
-    
-    return result
+    return _group_records(
+        df, group_col, "type", ["sale_count", "total_sales", "average_sale"], "total_sales"
+    )
 
 def get_sales_by_rep_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Get chart data for sales by sales representative."""
     # Look for sales rep and price columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    rep_cols = find_columns(df, "rep")
+    price_cols = find_columns(df, "price")
     
     if not rep_cols or not price_cols:
         return {"labels": [], "datasets": [{"label": "Sales", "data": []}]}
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    price_col = price_cols[0]
-    
-    # Group by sales rep and sum sales
-    rep_sales = df.groupby(rep_col)[price_col].sum().reset_index()
-    
-    # Sort by sales descending
-    rep_sales = rep_sales.sort_values(price_col, ascending=False)
-    
-    # Limit to top 10 reps
-    rep_sales = rep_sales.head(10)
+    # Top 10 reps by total sales
+    rep_sales = _group_stats(df, rep_cols[0])["total_sales"].nlargest(10)
     
     return {
-        "labels": rep_sales[rep_col].tolist(),
+        "labels": rep_sales.index.tolist(),
         "datasets": [{
             "label": "Sales",
-            "data": rep_sales[price_col].tolist()
+            "data": rep_sales.tolist()
         }]
     }
 
 def get_highest_profit_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the sale with the highest profit."""
     # Look for profit columns
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    profit_cols = find_columns(df, "profit")
     if not profit_cols:
         return None
     
@@ -663,18 +817,18 @@ def get_highest_profit_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     profit_col = profit_cols[0]
     
     # Get the row with the highest profit
-    if len(df) == 0:
+    highest_pos = _column_summary(df, profit_col)["argmax"]
+    if highest_pos is None:
         return None
     
-    highest_idx = df[profit_col].idxmax()
-    highest_row = df.loc[highest_idx]
+    highest_row = df.iloc[highest_pos]
     
     result = {
         "profit": float(highest_row[profit_col])
     }
     
     # Add price if available
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    price_cols = find_columns(df, "price")
     if price_cols:
         result["price"] = float(highest_row[price_cols[0]])
     
@@ -685,7 +839,7 @@ def get_highest_profit_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
             result[col] = highest_row[col]
     
     # Add sales rep if available
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
+    rep_cols = find_columns(df, "rep")
     if rep_cols:
         result["sales_rep"] = highest_row[rep_cols[0]]
     
@@ -694,8 +848,8 @@ def get_highest_profit_sale(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
 def get_profit_margin(df: pd.DataFrame) -> Optional[float]:
     """Get the overall profit margin."""
     # Look for profit and price columns
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
     
     if not profit_cols or not price_cols:
         return None
@@ -705,8 +859,8 @@ def get_profit_margin(df: pd.DataFrame) -> Optional[float]:
     price_col = price_cols[0]
     
     # Calculate profit margin
-    total_profit = df[profit_col].sum()
-    total_sales = df[price_col].sum()
+    total_profit = _column_summary(df, profit_col)["sum"]
+    total_sales = _column_summary(df, price_col)["sum"]
     
     if total_sales == 0:
         return 0.0
@@ -716,76 +870,41 @@ def get_profit_margin(df: pd.DataFrame) -> Optional[float]:
 def get_profit_by_rep(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get profit metrics by sales representative."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return []
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep
-    result = []
-    for rep, group in df.groupby(rep_col):
-        rep_data = {
-            "name": rep,
-            "sale_count": len(group),
-            "total_profit": float(group[profit_col].sum()),
-            "average_profit": float(group[profit_col].mean())
-        }
-        
-        result.append(rep_data)
-    
     # Sort by total profit descending
-    result.sort(key=lambda x: x["total_profit"], reverse=True)
-    
-    return result
+    return _group_records(
+        df, rep_cols[0], "name", ["sale_count", "total_profit", "average_profit"], "total_profit"
+    )
 
 def get_profit_by_lead_source(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get profit metrics by lead source."""
     # Look for lead source and profit columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
     
     if not source_cols or not profit_cols:
         return []
     
-    # Use the first columns found
-    source_col = source_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by lead source
-    result = []
-    for source, group in df.groupby(source_col):
-        source_data = {
-            "name": source,
-            "sale_count": len(group),
-            "total_profit": float(group[profit_col].sum()),
-            "average_profit": float(group[profit_col].mean())
-        }
-        
-        result.append(source_data)
-    
     # Sort by total profit descending
-    result.sort(key=lambda x: x["total_profit"], reverse=True)
-    
-    return result
+    return _group_records(
+        df, source_cols[0], "name", ["sale_count", "total_profit", "average_profit"], "total_profit"
+    )
 
 def get_profit_by_vehicle_type(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get profit metrics by vehicle type."""
     # Look for vehicle make/model and profit columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    make_cols = find_columns(df, "make")
+    model_cols = find_columns(df, "model")
+    profit_cols = find_columns(df, "profit")
     
     if not profit_cols:
         return []
     
-    # Use the first profit column found
-    profit_col = profit_cols[0]
-    
     # Group by make if available, otherwise use model if available
     if make_cols:
         group_col = make_cols[0]
@@ -794,27 +913,15 @@ def get_profit_by_vehicle_type(df: pd.DataFrame) -> List[Dict[str, Any]]:
     else:
         return []
     
-    # Group by vehicle type
-    result = []
-    for vehicle_type, group in df.groupby(group_col):
-        vehicle_data = {
-            "type": vehicle_type,
-            "sale_count": len(group),
-            "total_profit": float(group[profit_col].sum()),
-            "average_profit": float(group[profit_col].mean())
-        }
-        
-        result.append(vehicle_data)
-    
     # Sort by total profit descending
-    result.sort(key=lambda x: x["total_profit"], reverse=True)
-    
-    return result
+    return _group_records(
+        df, group_col, "type", ["sale_count", "total_profit", "average_profit"], "total_profit"
+    )
 
 def get_total_reps(df: pd.DataFrame) -> int:
     """Get the total number of sales representatives."""
     # Look for sales rep columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
+    rep_cols = find_columns(df, "rep")
     if not rep_cols:
         return 0
     
@@ -827,146 +934,76 @@ def get_total_reps(df: pd.DataFrame) -> int:
 def get_average_profit_per_rep(df: pd.DataFrame) -> Optional[float]:
     """Get the average profit per sales representative."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep and calculate average profit
-    rep_profit = df.groupby(rep_col)[profit_col].sum().reset_index()
+    # Average the total profit of each sales rep
+    rep_profit = _group_stats(df, rep_cols[0])["total_profit"]
     
     if len(rep_profit) == 0:
         return 0.0
     
-    return rep_profit[profit_col].mean()
+    return rep_profit.mean()
 
 def get_rep_leaderboard(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get a leaderboard of sales representatives by profit."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return []
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep and calculate metrics
-    rep_metrics = df.groupby(rep_col).agg({
-        profit_col: ['sum', 'mean', 'count']
-    }).reset_index()
-    
-    # Flatten the column names
-    rep_metrics.columns = ['name', 'total_profit', 'average_profit', 'sale_count']
-    
-    # Sort by total profit descending
-    rep_metrics = rep_metrics.sort_values('total_profit', ascending=False)
-    
-    # Convert to list of dictionaries
-    result = []
-    for _, row in rep_metrics.iterrows():
-        result.append({
-            "name": row['name'],
-            "total_profit": float(row['total_profit']),
-            "average_profit": float(row['average_profit']),
-            "sale_count": int(row['sale_count'])
-        })
-    
-    return result
+    # Per-rep metrics by total profit descending (sale_count counts sales with a profit value)
+    return _group_records(
+        df, rep_cols[0], "name",
+        ["total_profit", "average_profit", "profit_count"], "total_profit",
+        rename={"profit_count": "sale_count"}
+    )
 
 def get_rep_metrics(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get detailed metrics for each sales representative."""
     # Look for sales rep, profit, and price columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
     
     if not rep_cols:
         return []
     
-    # Use the first rep column found
-    rep_col = rep_cols[0]
-    
-    # Group by sales rep
-    result = []
-    for rep, group in df.groupby(rep_col):
-        rep_data = {
-            "name": rep,
-            "sale_count": len(group)
-        }
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            rep_data["total_profit"] = float(group[profit_col].sum())
-            rep_data["average_profit"] = float(group[profit_col].mean())
-            rep_data["highest_profit"] = float(group[profit_col].max())
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            rep_data["total_sales"] = float(group[price_col].sum())
-            rep_data["average_sale"] = float(group[price_col].mean())
-            rep_data["highest_sale"] = float(group[price_col].max())
-        
-        # Add profit margin if both profit and price are available
-        if profit_cols and price_cols:
-            profit_col = profit_cols[0]
-            price_col = price_cols[0]
-            total_profit = group[profit_col].sum()
-            total_sales = group[price_col].sum()
-            if total_sales > 0:
-                rep_data["profit_margin"] = (total_profit / total_sales) * 100
-        
-        result.append(rep_data)
+    # Include profit and price metrics if available
+    columns = ["sale_count"]
+    if profit_cols:
+        columns += ["total_profit", "average_profit", "highest_profit"]
+    if price_cols:
+        columns += ["total_sales", "average_sale", "highest_sale"]
     
     # Sort by total profit or sales descending
-    if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+    result = _group_records(df, rep_cols[0], "name", columns, _metrics_sort_column(df))
+    
+    # Add profit margin if both profit and price are available
+    if profit_cols and price_cols:
+        _add_ratio(result, "profit_margin", "total_profit", "total_sales")
     
     return result
 
 def get_rep_performance_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Get chart data for sales representative performance."""
     # Look for sales rep and profit columns
-    rep_cols = [col for col in df.columns if any(term in col.lower() for term in ['sales_rep', 'salesperson', 'rep_name'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    rep_cols = find_columns(df, "rep")
+    profit_cols = find_columns(df, "profit")
     
     if not rep_cols or not profit_cols:
         return {"labels": [], "datasets": [{"label": "Profit", "data": []}, {"label": "Sales Count", "data": []}]}
     
-    # Use the first columns found
-    rep_col = rep_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by sales rep and calculate metrics
-    rep_metrics = df.groupby(rep_col).agg({
-        profit_col: 'sum',
-        rep_col: 'count'
-    }).reset_index()
-    
-    # Rename columns
-    rep_metrics.columns = ['name', 'total_profit', 'sale_count']
-    
-    # Sort by total profit descending
-    rep_metrics = rep_metrics.sort_values('total_profit', ascending=False)
-    
-    # Limit to top 10 reps
-    rep_metrics = rep_metrics.head(10)
+    # Top 10 reps by total profit
+    rep_metrics = _group_stats(df, rep_cols[0]).nlargest(10, 'total_profit')
     
     return {
-        "labels": rep_metrics['name'].tolist(),
+        "labels": rep_metrics.index.tolist(),
         "datasets": [
             {
                 "label": "Profit",
@@ -982,7 +1019,7 @@ def get_rep_performance_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
 def get_total_lead_sources(df: pd.DataFrame) -> int:
     """Get the total number of lead sources."""
     # Look for lead source columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
+    source_cols = find_columns(df, "source")
     if not source_cols:
         return 0
     
@@ -995,175 +1032,94 @@ def get_total_lead_sources(df: pd.DataFrame) -> int:
 def get_average_profit_per_source(df: pd.DataFrame) -> Optional[float]:
     """Get the average profit per lead source."""
     # Look for lead source and profit columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
     
     if not source_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    source_col = source_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by lead source and calculate average profit
-    source_profit = df.groupby(source_col)[profit_col].sum().reset_index()
+    # Average the total profit of each lead source
+    source_profit = _group_stats(df, source_cols[0])["total_profit"]
     
     if len(source_profit) == 0:
         return 0.0
     
-    return source_profit[profit_col].mean()
+    return source_profit.mean()
 
 def get_lead_source_metrics(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get detailed metrics for each lead source."""
     # Look for lead source, profit, and price columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
-    expense_cols = [col for col in df.columns if any(term in col.lower() for term in ['expense', 'cost'])]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
+    expense_cols = find_columns(df, "expense")
     
     if not source_cols:
         return []
     
-    # Use the first source column found
-    source_col = source_cols[0]
-    
-    # Group by lead source
-    result = []
-    for source, group in df.groupby(source_col):
-        source_data = {
-            "name": source,
-            "sale_count": len(group)
-        }
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            source_data["total_profit"] = float(group[profit_col].sum())
-            source_data["average_profit"] = float(group[profit_col].mean())
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            source_data["total_sales"] = float(group[price_col].sum())
-            source_data["average_sale"] = float(group[price_col].mean())
-        
-        # Add expense metrics if available
-        if expense_cols:
-            expense_col = expense_cols[0]
-            source_data["total_expense"] = float(group[expense_col].sum())
-            source_data["average_expense"] = float(group[expense_col].mean())
-        
-        # Add ROI if both profit and expense are available
-        if profit_cols and expense_cols:
-            profit_col = profit_cols[0]
-            expense_col = expense_cols[0]
-            total_profit = group[profit_col].sum()
-            total_expense = group[expense_col].sum()
-            if total_expense > 0:
-                source_data["roi"] = (total_profit / total_expense) * 100
-        
-        result.append(source_data)
+    # Include profit, price and expense metrics if available
+    columns = ["sale_count"]
+    if profit_cols:
+        columns += ["total_profit", "average_profit"]
+    if price_cols:
+        columns += ["total_sales", "average_sale"]
+    if expense_cols:
+        columns += ["total_expense", "average_expense"]
     
     # Sort by total profit or sales descending
-    if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+    result = _group_records(df, source_cols[0], "name", columns, _metrics_sort_column(df))
+    
+    # Add ROI if both profit and expense are available
+    if profit_cols and expense_cols:
+        _add_ratio(result, "roi", "total_profit", "total_expense")
     
     return result
 
 def get_lead_source_roi(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get ROI metrics for each lead source."""
     # Look for lead source, profit, and expense columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    expense_cols = [col for col in df.columns if any(term in col.lower() for term in ['expense', 'cost'])]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
+    expense_cols = find_columns(df, "expense")
     
     if not source_cols or not profit_cols or not expense_cols:
         return []
     
-    # Use the first columns found
-    source_col = source_cols[0]
-    profit_col = profit_cols[0]
-    expense_col = expense_cols[0]
-    
-    # Group by lead source and calculate metrics
-    source_metrics = df.groupby(source_col).agg({
-        profit_col: 'sum',
-        expense_col: 'sum',
-        source_col: 'count'
-    }).reset_index()
-    
-    # Rename columns
-    source_metrics.columns = ['name', 'total_profit', 'total_expense', 'sale_count']
+    # Get the per-source totals
+    source_metrics = _group_stats(df, source_cols[0])[['total_profit', 'total_expense', 'sale_count']]
+    source_metrics = source_metrics.astype({'total_profit': float, 'total_expense': float})
     
     # Calculate ROI
-    source_metrics['roi'] = source_metrics.apply(
-        lambda row: (row['total_profit'] / row['total_expense']) * 100 if row['total_expense'] > 0 else 0,
-        axis=1
-    )
+    source_metrics = source_metrics.assign(roi=_roi(source_metrics))
     
-    # Sort by ROI descending
+    # Sort by ROI descending and convert to list of dictionaries
     source_metrics = source_metrics.sort_values('roi', ascending=False)
-    
-    # Convert to list of dictionaries
-    result = []
-    for _, row in source_metrics.iterrows():
-        result.append({
-            "name": row['name'],
-            "total_profit": float(row['total_profit']),
-            "total_expense": float(row['total_expense']),
-            "sale_count": int(row['sale_count']),
-            "roi": float(row['roi'])
-        })
-    
-    return result
+    return _records(source_metrics, "name")
 
 def get_lead_source_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Get chart data for lead source performance."""
     # Look for lead source, profit, and expense columns
-    source_cols = [col for col in df.columns if any(term in col.lower() for term in ['lead_source', 'source'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    expense_cols = [col for col in df.columns if any(term in col.lower() for term in ['expense', 'cost'])]
+    source_cols = find_columns(df, "source")
+    profit_cols = find_columns(df, "profit")
+    expense_cols = find_columns(df, "expense")
     
     if not source_cols or not profit_cols:
         return {"labels": [], "datasets": [{"label": "Profit", "data": []}]}
     
-    # Use the first columns found
-    source_col = source_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by lead source and calculate profit
-    source_profit = df.groupby(source_col)[profit_col].sum().reset_index()
-    
-    # Sort by profit descending
-    source_profit = source_profit.sort_values(profit_col, ascending=False)
-    
-    # Limit to top 10 sources
-    source_profit = source_profit.head(10)
+    # Top 10 sources by total profit
+    source_profit = _group_stats(df, source_cols[0]).nlargest(10, 'total_profit')
     
     # If expense data is available, add ROI dataset
     if expense_cols:
-        expense_col = expense_cols[0]
-        source_expense = df.groupby(source_col)[expense_col].sum().reset_index()
-        
-        # Merge profit and expense data
-        source_data = pd.merge(source_profit, source_expense, on=source_col)
-        
         # Calculate ROI
-        source_data['roi'] = source_data.apply(
-            lambda row: (row[profit_col] / row[expense_col]) * 100 if row[expense_col] > 0 else 0,
-            axis=1
-        )
+        source_data = source_profit.assign(roi=_roi(source_profit))
         
         return {
-            "labels": source_data[source_col].tolist(),
+            "labels": source_data.index.tolist(),
             "datasets": [
                 {
                     "label": "Profit",
-                    "data": source_data[profit_col].tolist()
+                    "data": source_data['total_profit'].tolist()
                 },
                 {
                     "label": "ROI (%)",
@@ -1174,71 +1130,41 @@ def get_lead_source_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     
     # If expense data is not available, just return profit data
     return {
-        "labels": source_profit[source_col].tolist(),
+        "labels": source_profit.index.tolist(),
         "datasets": [{
             "label": "Profit",
-            "data": source_profit[profit_col].tolist()
+            "data": source_profit['total_profit'].tolist()
         }]
     }
 
 def get_top_vehicle_make(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the top performing vehicle make by profit."""
     # Look for vehicle make and profit columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    make_cols = find_columns(df, "make")
+    profit_cols = find_columns(df, "profit")
     
     if not make_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    make_col = make_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by make and sum profit
-    make_profit = df.groupby(make_col)[profit_col].sum().reset_index()
-    
-    # Get the top make
-    if len(make_profit) == 0:
-        return None
-    
-    top_make = make_profit.loc[make_profit[profit_col].idxmax()]
-    return {
-        "name": top_make[make_col],
-        "total_profit": float(top_make[profit_col]),
-        "sale_count": int(df[df[make_col] == top_make[make_col]].shape[0])
-    }
+    # Get the make with the highest total profit
+    return _top_group(df, make_cols[0])
 
 def get_top_vehicle_model(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     """Get the top performing vehicle model by profit."""
     # Look for vehicle model and profit columns
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    model_cols = find_columns(df, "model")
+    profit_cols = find_columns(df, "profit")
     
     if not model_cols or not profit_cols:
         return None
     
-    # Use the first columns found
-    model_col = model_cols[0]
-    profit_col = profit_cols[0]
-    
-    # Group by model and sum profit
-    model_profit = df.groupby(model_col)[profit_col].sum().reset_index()
-    
-    # Get the top model
-    if len(model_profit) == 0:
-        return None
-    
-    top_model = model_profit.loc[model_profit[profit_col].idxmax()]
-    return {
-        "name": top_model[model_col],
-        "total_profit": float(top_model[profit_col]),
-        "sale_count": int(df[df[model_col] == top_model[model_col]].shape[0])
-    }
+    # Get the model with the highest total profit
+    return _top_group(df, model_cols[0])
 
 def get_average_days_to_sell(df: pd.DataFrame) -> Optional[float]:
     """Get the average days to sell a vehicle."""
     # Look for days to close/sell columns
-    days_cols = [col for col in df.columns if any(term in col.lower() for term in ['days_to_close', 'days_to_sell'])]
+    days_cols = find_columns(df, "days")
     if not days_cols:
         return None
     
@@ -1251,19 +1177,16 @@ def get_average_days_to_sell(df: pd.DataFrame) -> Optional[float]:
 def get_vehicle_metrics(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get detailed metrics for each vehicle type."""
     # Look for vehicle make/model, profit, and price columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
-    days_cols = [col for col in df.columns if any(term in col.lower() for term in ['days_to_close', 'days_to_sell'])]
+    make_cols = find_columns(df, "make")
+    model_cols = find_columns(df, "model")
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
+    days_cols = find_columns(df, "days")
     
     # Determine grouping column
     if make_cols and model_cols:
-        # If both make and model are available, combine them
-        make_col = make_cols[0]
-        model_col = model_cols[0]
-        df['vehicle_type'] = df[make_col] + ' ' + df[model_col]
-        group_col = 'vehicle_type'
+        # If both make and model are available, group on the pair ("make model")
+        group_col = [make_cols[0], model_cols[0]]
     elif make_cols:
         group_col = make_cols[0]
     elif model_cols:
@@ -1271,139 +1194,64 @@ def get_vehicle_metrics(df: pd.DataFrame) -> List[Dict[str, Any]]:
     else:
         return []
     
-    # Group by vehicle type
-    result = []
-    for vehicle_type, group in df.groupby(group_col):
-        vehicle_data = {
-            "type": vehicle_type,
-            "sale_count": len(group)
-        }
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            vehicle_data["total_profit"] = float(group[profit_col].sum())
-            vehicle_data["average_profit"] = float(group[profit_col].mean())
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            vehicle_data["total_sales"] = float(group[price_col].sum())
-            vehicle_data["average_sale"] = float(group[price_col].mean())
-        
-        # Add days to sell metrics if available
-        if days_cols:
-            days_col = days_cols[0]
-            vehicle_data["average_days_to_sell"] = float(group[days_col].mean())
-        
-        result.append(vehicle_data)
-    
-    # Sort by total profit or sales descending
+    # Include profit, price and days to sell metrics if available
+    columns = ["sale_count"]
     if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+        columns += ["total_profit", "average_profit"]
+    if price_cols:
+        columns += ["total_sales", "average_sale"]
+    if days_cols:
+        columns.append("average_days_to_sell")
     
-    return result
+    # Sort by total profit or sales descending
+    return _group_records(df, group_col, "type", columns, _metrics_sort_column(df))
 
 def get_make_performance(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get performance metrics for each vehicle make."""
     # Look for vehicle make, profit, and price columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    make_cols = find_columns(df, "make")
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
     
     if not make_cols:
         return []
     
-    # Use the first make column found
-    make_col = make_cols[0]
-    
-    # Group by make
-    result = []
-    for make, group in df.groupby(make_col):
-        make_data = {
-            "make": make,
-            "sale_count": len(group)
-        }
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            make_data["total_profit"] = float(group[profit_col].sum())
-            make_data["average_profit"] = float(group[profit_col].mean())
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            make_data["total_sales"] = float(group[price_col].sum())
-            make_data["average_sale"] = float(group[price_col].mean())
-        
-        result.append(make_data)
-    
-    # Sort by total profit or sales descending
+    # Include profit and price metrics if available
+    columns = ["sale_count"]
     if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+        columns += ["total_profit", "average_profit"]
+    if price_cols:
+        columns += ["total_sales", "average_sale"]
     
-    return result
+    # Sort by total profit or sales descending
+    return _group_records(df, make_cols[0], "make", columns, _metrics_sort_column(df))
 
 def get_model_performance(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Get performance metrics for each vehicle model."""
     # Look for vehicle model, profit, and price columns
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
-    price_cols = [col for col in df.columns if any(term in col.lower() for term in ['sold_price', 'selling_price', 'sale_price'])]
+    model_cols = find_columns(df, "model")
+    profit_cols = find_columns(df, "profit")
+    price_cols = find_columns(df, "price")
     
     if not model_cols:
         return []
     
-    # Use the first model column found
-    model_col = model_cols[0]
-    
-    # Group by model
-    result = []
-    for model, group in df.groupby(model_col):
-        model_data = {
-            "model": model,
-            "sale_count": len(group)
-        }
-        
-        # Add profit metrics if available
-        if profit_cols:
-            profit_col = profit_cols[0]
-            model_data["total_profit"] = float(group[profit_col].sum())
-            model_data["average_profit"] = float(group[profit_col].mean())
-        
-        # Add price metrics if available
-        if price_cols:
-            price_col = price_cols[0]
-            model_data["total_sales"] = float(group[price_col].sum())
-            model_data["average_sale"] = float(group[price_col].mean())
-        
-        result.append(model_data)
-    
-    # Sort by total profit or sales descending
+    # Include profit and price metrics if available
+    columns = ["sale_count"]
     if profit_cols:
-        result.sort(key=lambda x: x.get("total_profit", 0), reverse=True)
-    elif price_cols:
-        result.sort(key=lambda x: x.get("total_sales", 0), reverse=True)
-    else:
-        result.sort(key=lambda x: x["sale_count"], reverse=True)
+        columns += ["total_profit", "average_profit"]
+    if price_cols:
+        columns += ["total_sales", "average_sale"]
     
-    return result
+    # Sort by total profit or sales descending
+    return _group_records(df, model_cols[0], "model", columns, _metrics_sort_column(df))
 
 def get_vehicle_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Get chart data for vehicle performance."""
     # Look for vehicle make/model and profit columns
-    make_cols = [col for col in df.columns if any(term in col.lower() for term in ['make', 'vehicle_make'])]
-    model_cols = [col for col in df.columns if any(term in col.lower() for term in ['model', 'vehicle_model'])]
-    profit_cols = [col for col in df.columns if 'profit' in col.lower()]
+    make_cols = find_columns(df, "make")
+    model_cols = find_columns(df, "model")
+    profit_cols = find_columns(df, "profit")
     
     # Determine grouping column
     if make_cols:
@@ -1413,35 +1261,24 @@ def get_vehicle_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
     else:
         return {"labels": [], "datasets": [{"label": "Profit", "data": []}]}
     
-    # Use the first profit column found if available
+    # Use profit if available
     if profit_cols:
-        profit_col = profit_cols[0]
-        
-        # Group by vehicle type and sum profit
-        vehicle_profit = df.groupby(group_col)[profit_col].sum().reset_index()
-        
-        # Sort by profit descending
-        vehicle_profit = vehicle_profit.sort_values(profit_col, ascending=False)
-        
-        # Limit to top 10 vehicles
-        vehicle_profit = vehicle_profit.head(10)
+        # Top 10 vehicles by total profit
+        vehicle_profit = _group_stats(df, group_col)["total_profit"].nlargest(10)
         
         return {
-            "labels": vehicle_profit[group_col].tolist(),
+            "labels": vehicle_profit.index.tolist(),
             "datasets": [{
                 "label": "Profit",
-                "data": vehicle_profit[profit_col].tolist()
+                "data": vehicle_profit.tolist()
             }]
         }
     
     # If profit data is not available, use count
-    vehicle_count = df[group_col].value_counts().reset_index()
+    vehicle_count = _text_column(df[group_col]).value_counts().reset_index()
     vehicle_count.columns = [group_col, 'count']
     
-    # Sort by count descending
-    vehicle_count = vehicle_count.sort_values('count', ascending=False)
-    
-    # Limit to top 10 vehicles
+    # value_counts is already sorted by count descending; keep the top 10 vehicles
     vehicle_count = vehicle_count.head(10)
     
     return {
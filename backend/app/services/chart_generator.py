@@ -4,38 +4,64 @@ Chart generation utilities for Watchdog AI.
 This module handles generating charts from analysis data.
 """
 import os
+import hashlib
+import json
 import logging
-import matplotlib.pyplot as plt
-import matplotlib
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from typing import Dict, Any, List, Optional
 import uuid
 
 from app.core.config import settings
 
-# Configure matplotlib to use Agg backend (non-interactive)
-matplotlib.use('Agg')
-
 # Configure logging
 logger = logging.getLogger("watchdog.chart_generator")
 
-def generate_chart(chart_data: Dict[str, Any], filename: str, chart_type: str = "bar") -> str:
+# Chart titles by chart type and whether there is a single dataset
+# ("{}" is the first dataset's label)
+_CHART_TITLES = {
+    ("bar", True): "{} by Category",
+    ("bar", False): "Category Comparison",
+    ("line", True): "{} Trend",
+    ("line", False): "Trend Comparison",
+    ("pie", True): "{} Distribution",
+    ("pie", False): "{} Distribution",
+}
+
+# zlib level for chart PNGs; charts are short-lived, so favor encoding speed over size
+PNG_COMPRESS_LEVEL = 1
+
+def chart_key(chart_data: Dict[str, Any], chart_type: str) -> str:
+    """
+    Get a content hash identifying a chart.
+    
+    Args:
+        chart_data: Dictionary containing chart data (labels and datasets)
+        chart_type: Type of chart
+        
+    Returns:
+        Hex digest of the chart data and type
+    """
+    content = json.dumps({"data": chart_data, "type": chart_type}, sort_keys=True, default=str)
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+def generate_chart(chart_data: Dict[str, Any], chart_type: str = "bar") -> str:
     """
     Generate a chart from the provided data.
     
+    Chart images are named by a hash of their data and type, so a chart that
+    was already rendered (for example, when a dashboard refreshes the same
+    analysis) is served from disk instead of being drawn again.
+    
     Args:
         chart_data: Dictionary containing chart data (labels and datasets)
-        filename: Filename for the chart image
         chart_type: Type of chart to generate (bar, line, pie)
         
     Returns:
         URL path to the generated chart
     """
-    logger.info(f"Generating {chart_type} chart: {filename}")
-    
-    # Create figure and axis
-    plt.figure(figsize=(10, 6))
-    
     # Get chart data
     labels = chart_data.get("labels", [])
     datasets = chart_data.get("datasets", [])
@@ -44,41 +70,85 @@ def generate_chart(chart_data: Dict[str, Any], filename: str, chart_type: str =
         logger.warning("Chart data is empty")
         return ""
     
+    filename = f"{chart_key(chart_data, chart_type)}.png"
+    chart_path = os.path.join(settings.CHARTS_DIR, filename)
+    chart_url = f"/static/charts/{filename}"
+    
+    # Reuse an existing image, marking it as recently used
+    try:
+        os.utime(chart_path)
+        logger.info("Reusing %s chart: %s", chart_type, filename)
+        return chart_url
+    except FileNotFoundError:
+        pass
+    
+    logger.info("Generating %s chart: %s", chart_type, filename)
+    
+    # Create figure and axis on their own Agg canvas (no pyplot global state,
+    # so charts can be drawn from any thread and need no explicit close)
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    
     # Generate chart based on type
     if chart_type == "bar":
-        generate_bar_chart(labels, datasets)
+        generate_bar_chart(ax, labels, datasets)
     elif chart_type == "line":
-        generate_line_chart(labels, datasets)
+        generate_line_chart(ax, labels, datasets)
     elif chart_type == "pie":
-        generate_pie_chart(labels, datasets)
+        generate_pie_chart(ax, labels, datasets)
     else:
         # Default to bar chart
-        generate_bar_chart(labels, datasets)
+        generate_bar_chart(ax, labels, datasets)
     
     # Add title and labels
-    plt.title(get_chart_title(chart_type, datasets), fontsize=14)
-    plt.xlabel("Categories", fontsize=12)
-    plt.ylabel("Values", fontsize=12)
+    ax.set_title(get_chart_title(chart_type, datasets), fontsize=14)
+    ax.set_xlabel("Categories", fontsize=12)
+    ax.set_ylabel("Values", fontsize=12)
     
     # Add grid
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
-    # Adjust layout
-    plt.tight_layout()
+    # Adjust layout (this fits the rotated labels, so saving needs no second
+    # bbox_inches='tight' render pass)
+    fig.tight_layout()
     
-    # Save chart
-    chart_path = os.path.join(settings.CHARTS_DIR, filename)
-    plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    # Save chart to a temporary file and move it into place, so a concurrent
+    # request for the same chart never serves a partly written image
+    temp_path = f"{chart_path}.{uuid.uuid4().hex}.tmp"
+    fig.savefig(temp_path, format="png", dpi=100, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
+    os.replace(temp_path, chart_path)
+    
+    evict_charts()
     
     # Return URL path to chart
-    return f"/static/charts/{filename}"
+    return chart_url
+
+def evict_charts() -> None:
+    """Delete the least recently used chart images beyond settings.MAX_CHARTS."""
+    with os.scandir(settings.CHARTS_DIR) as entries:
+        charts = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries if entry.name.endswith(".png")
+        ]
+    
+    excess = len(charts) - settings.MAX_CHARTS
+    if excess <= 0:
+        return
+    
+    for _, path in sorted(charts)[:excess]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Already removed by a concurrent eviction
+            pass
 
-def generate_bar_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> None:
+def generate_bar_chart(ax: Axes, labels: List[str], datasets: List[Dict[str, Any]]) -> None:
     """
     Generate a bar chart.
     
     Args:
+        ax: Axes to draw on
         labels: List of category labels
         datasets: List of datasets containing values
     """
@@ -96,20 +166,21 @@ def generate_bar_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> Non
         offset = (i - num_datasets / 2 + 0.5) * bar_width
         
         # Create bars
-        plt.bar(index + offset, data, bar_width, label=label)
+        ax.bar(index + offset, data, bar_width, label=label)
     
     # Set x-axis labels
-    plt.xticks(range(len(labels)), labels, rotation=45, ha='right')
+    ax.set_xticks(range(len(labels)), labels, rotation=45, ha='right')
     
     # Add legend if multiple datasets
     if num_datasets > 1:
-        plt.legend()
+        ax.legend()
 
-def generate_line_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> None:
+def generate_line_chart(ax: Axes, labels: List[str], datasets: List[Dict[str, Any]]) -> None:
     """
     Generate a line chart.
     
     Args:
+        ax: Axes to draw on
         labels: List of category labels
         datasets: List of datasets containing values
     """
@@ -119,20 +190,21 @@ def generate_line_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> No
         label = dataset.get("label", f"Dataset {i+1}")
         
         # Create line
-        plt.plot(range(len(labels)), data, marker='o', label=label)
+        ax.plot(range(len(labels)), data, marker='o', label=label)
     
     # Set x-axis labels
-    plt.xticks(range(len(labels)), labels, rotation=45, ha='right')
+    ax.set_xticks(range(len(labels)), labels, rotation=45, ha='right')
     
     # Add legend if multiple datasets
     if len(datasets) > 1:
-        plt.legend()
+        ax.legend()
 
-def generate_pie_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> None:
+def generate_pie_chart(ax: Axes, labels: List[str], datasets: List[Dict[str, Any]]) -> None:
     """
     Generate a pie chart.
     
     Args:
+        ax: Axes to draw on
         labels: List of category labels
         datasets: List of datasets containing values
     """
@@ -141,8 +213,8 @@ def generate_pie_chart(labels: List[str], datasets: List[Dict[str, Any]]) -> Non
         data = datasets[0].get("data", [])
         
         # Create pie chart
-        plt.pie(data, labels=labels, autopct='%1.1f%%', startangle=90)
-        plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        ax.pie(data, labels=labels, autopct='%1.1f%%', startangle=90)
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
 
 def get_chart_title(chart_type: str, datasets: List[Dict[str, Any]]) -> str:
     """
@@ -155,21 +227,6 @@ def get_chart_title(chart_type: str, datasets: List[Dict[str, Any]]) -> str:
     Returns:
         Chart title
     """
-    # Get dataset labels
-    dataset_labels = [dataset.get("label", "Data") for dataset in datasets]
-    
-    # Generate title based on chart type and datasets
-    if chart_type == "bar":
-        if len(dataset_labels) == 1:
-            return f"{dataset_labels[0]} by Category"
-        else:
-            return "Category Comparison"
-    elif chart_type == "line":
-        if len(dataset_labels) == 1:
-            return f"{dataset_labels[0]} Trend"
-        else:
-            return "Trend Comparison"
-    elif chart_type == "pie":
-        return f"{dataset_labels[0]} Distribution"
-    else:
-        return "Data Visualization"
+    # Only the first dataset's label is used in titles
+    title = _CHART_TITLES.get((chart_type, len(datasets) == 1), "Data Visualization")
+    return title.format(datasets[0].get("label", "Data") if datasets else "Data")
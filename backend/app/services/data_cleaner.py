@@ -7,10 +7,39 @@ import pandas as pd
 import numpy as np
 import re
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger("watchdog.data_cleaner")
 
+# Patterns used to convert column names to snake_case
+_WORD_BOUNDARY = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile('([a-z0-9])([A-Z])')
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
+_REPEATED_UNDERSCORES = re.compile(r'_+')
+# Names that are already snake_case (the conversion would leave them unchanged)
+_SNAKE_CASE = re.compile(r'[a-z0-9]+(?:_[a-z0-9]+)*')
+
+# Column name substrings that mark monetary and date columns, each joined into
+# one pattern so a column name is matched in a single search
+_MONETARY_NAME = re.compile('|'.join([
+    'price', 'cost', 'revenue', 'sale', 'profit', 'expense', 'gross', 'income',
+    'budget', 'payment', 'fee', 'charge', 'amount', 'total'
+]))
+_DATE_NAME = re.compile('|'.join([
+    'date', 'day', 'month', 'year', 'time', 'created', 'updated',
+    'timestamp', 'sold', 'purchased', 'closed'
+]))
+
+# Characters that mark a text column's values as monetary
+_MONETARY_MARK = re.compile(r'[$,]')
+
+# Currency symbols, thousands separators and whitespace stripped from monetary values
+_MONETARY_NOISE = re.compile(r'[$,\s]')
+
+# Any digit (text without one is rejected as a date without trial parsing)
+_DIGIT = re.compile(r'\d')
+
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and normalize a DataFrame for analysis.
@@ -21,28 +50,28 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame
     """
-    logger.info(f"Cleaning DataFrame with {len(df)} rows and {len(df.columns)} columns")
+    logger.info("Cleaning DataFrame with %s rows and %s columns", len(df), len(df.columns))
     
-    # Create a copy to avoid modifying the original
-    cleaned_df = df.copy()
+    # Normalize column names (this returns a new frame; every step below replaces
+    # whole columns rather than writing into them, so df itself is never modified
+    # and no data is copied up front)
+    cleaned_df = normalize_column_names(df)
     
-    # Normalize column names
-    cleaned_df = normalize_column_names(cleaned_df)
+    # Identify monetary and date columns
+    monetary_columns, date_columns = classify_columns(cleaned_df)
     
     # Clean monetary values
-    monetary_columns = identify_monetary_columns(cleaned_df)
     for column in monetary_columns:
         cleaned_df[column] = clean_monetary_values(cleaned_df[column])
     
     # Clean date columns
-    date_columns = identify_date_columns(cleaned_df)
     for column in date_columns:
         cleaned_df[column] = clean_dates(cleaned_df[column])
     
     # Handle missing values
     cleaned_df = handle_missing_values(cleaned_df)
     
-    logger.info(f"Cleaning complete. DataFrame has {len(cleaned_df)} rows and {len(cleaned_df.columns)} columns")
+    logger.info("Cleaning complete. DataFrame has %s rows and %s columns", len(cleaned_df), len(cleaned_df.columns))
     
     return cleaned_df
 
@@ -56,57 +85,77 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with normalized column names
     """
-    # Create a copy to avoid modifying the original
-    result = df.copy()
-    
-    # Function to convert to snake_case
-    def to_snake_case(name):
-        # Replace spaces and special characters with underscores
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
-        # Replace multiple spaces/special chars with a single underscore
-        s3 = re.sub(r'[^a-zA-Z0-9]', '_', s2)
-        # Convert to lowercase and remove leading/trailing underscores
-        return re.sub(r'_+', '_', s3).lower().strip('_')
+    # Shallow copy, so renaming the columns doesn't copy the data or modify the original
+    result = df.copy(deep=False)
     
     # Apply the function to all column names
-    result.columns = [to_snake_case(col) for col in result.columns]
+    result.columns = list(map(to_snake_case, result.columns))
     
     return result
 
-def identify_monetary_columns(df: pd.DataFrame) -> List[str]:
+@lru_cache(maxsize=4096)
+def to_snake_case(name: str) -> str:
+    """
+    Convert a column name to snake_case.
+    
+    Uploads of the same export share their headers, so conversions are cached,
+    and names that are already snake_case are returned as they are.
     """
-    Identify columns that likely contain monetary values.
+    if _SNAKE_CASE.fullmatch(name):
+        return name
+    
+    # Replace spaces and special characters with underscores
+    s1 = _WORD_BOUNDARY.sub(r'\1_\2', name)
+    s2 = _CAMEL_BOUNDARY.sub(r'\1_\2', s1)
+    # Replace multiple spaces/special chars with a single underscore
+    s3 = _NON_ALPHANUMERIC.sub('_', s2)
+    # Convert to lowercase and remove leading/trailing underscores
+    return _REPEATED_UNDERSCORES.sub('_', s3).lower().strip('_')
+
+def classify_columns(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+    """
+    Identify columns that likely contain monetary values and date values.
+    
+    Columns are classified in a single pass, so each column's name is matched
+    and its values are sampled only once.
     
     Args:
         df: DataFrame to analyze
         
     Returns:
-        List of column names that likely contain monetary values
+        Tuple of the monetary column names and the date column names (monetary
+        columns are cleaned first, so only their names can mark them as dates)
     """
     monetary_columns = []
+    date_columns = []
     
-    # Common monetary column name patterns
-    monetary_patterns = [
-        'price', 'cost', 'revenue', 'sale', 'profit', 'expense', 'gross', 'income',
-        'budget', 'payment', 'fee', 'charge', 'amount', 'total'
-    ]
-    
-    # Check each column
-    for column in df.columns:
-        # Check if column name contains monetary pattern
-        if any(pattern in column.lower() for pattern in monetary_patterns):
-            monetary_columns.append(column)
-            continue
+    # Check each column (with its dtype, so text columns are found without
+    # building a Series for every column)
+    for column, dtype in zip(df.columns, df.dtypes):
+        name = column.lower()
+        
+        # Check if column name contains monetary or date pattern
+        is_monetary = _MONETARY_NAME.search(name) is not None
+        is_date = _DATE_NAME.search(name) is not None
+        
+        # Check the values of text columns the name didn't classify
+        if not (is_monetary and is_date) and dtype == 'object':
+            sample = sample_values(df[column], 100)
+            
+            # Check if column contains values with dollar signs or commas
+            if not is_monetary:
+                is_monetary = sample.astype(str).str.contains(_MONETARY_MARK).any()
+            
+            # Check if the column's values look like dates
+            if not is_date and not is_monetary:
+                is_date = looks_like_dates(sample.head(10))
         
-        # Check if column contains values with dollar signs or commas
-        if df[column].dtype == 'object':
-            sample = df[column].dropna().astype(str).head(100)
-            if sample.str.contains(r'^\$|\$|\,').any():
-                monetary_columns.append(column)
-                continue
+        if is_monetary:
+            monetary_columns.append(column)
+        if is_date:
+            date_columns.append(column)
     
-    return monetary_columns
+    return monetary_columns, date_columns
 
 def clean_monetary_values(series: pd.Series) -> pd.Series:
     """
@@ -118,64 +167,57 @@ def clean_monetary_values(series: pd.Series) -> pd.Series:
     Returns:
         Cleaned series as float values
     """
-    # Convert to string first to handle mixed types
-    str_series = series.astype(str)
+    # Convert to string first to handle mixed types, then strip currency symbols,
+    # commas and whitespace from every value at once
+    cleaned = series.astype(str).str.replace(_MONETARY_NOISE, '', regex=True)
     
-    # Function to clean individual values
-    def clean_value(value):
-        if pd.isna(value):
-            return np.nan
-        
-        # Remove currency symbols, commas, and whitespace
-        cleaned = re.sub(r'[$,\s]', '', str(value))
-        
-        # Handle empty strings
-        if not cleaned:
-            return np.nan
-        
-        try:
-            return float(cleaned)
-        except ValueError:
-            return np.nan
-    
-    # Apply the cleaning function
-    return str_series.apply(clean_value)
+    # Parse as floats; empty strings and anything else unparseable become NaN
+    return pd.to_numeric(cleaned, errors='coerce').astype(float)
 
-def identify_date_columns(df: pd.DataFrame) -> List[str]:
+def sample_values(series: pd.Series, n: int) -> pd.Series:
     """
-    Identify columns that likely contain date values.
+    Get the first n non-null values of a series.
+    
+    Only the start of the series is scanned, unless it has too many missing
+    values there, so sampling a long column doesn't copy all of it.
     
     Args:
-        df: DataFrame to analyze
+        series: Series to sample
+        n: Number of values to return
         
     Returns:
-        List of column names that likely contain date values
+        Series of up to n non-null values
     """
-    date_columns = []
+    window = n * 4
+    sample = series.iloc[:window].dropna()
+    if len(sample) < n and len(series) > window:
+        sample = series.dropna()
+    return sample.head(n)
+
+def looks_like_dates(sample: pd.Series) -> bool:
+    """
+    Check whether a sample of values parses as dates.
     
-    # Common date column name patterns
-    date_patterns = [
-        'date', 'day', 'month', 'year', 'time', 'created', 'updated',
-        'timestamp', 'sold', 'purchased', 'closed'
-    ]
+    Samples with a value that contains no digit are rejected without parsing,
+    as pd.to_datetime is slow to fail on plain text (this also rejects words
+    such as 'today' or 'now', which pandas would parse). Other samples must
+    parse with pd.to_datetime, which infers a single format from the first
+    value, so mixed formats are rejected rather than cleaned into NaT.
     
-    # Check each column
-    for column in df.columns:
-        # Check if column name contains date pattern
-        if any(pattern in column.lower() for pattern in date_patterns):
-            date_columns.append(column)
-            continue
+    Args:
+        sample: Non-null values to check
         
-        # Check if column can be converted to datetime
-        if df[column].dtype == 'object':
-            sample = df[column].dropna().head(10)
-            try:
-                pd.to_datetime(sample)
-                date_columns.append(column)
-            except:
-                pass
+    Returns:
+        True if the values can be converted to datetime
+    """
+    if not sample.astype(str).str.contains(_DIGIT).all():
+        return False
     
-    return date_columns
+    try:
+        pd.to_datetime(sample)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
 
 def clean_dates(series: pd.Series) -> pd.Series:
     """
@@ -204,15 +246,17 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with handled missing values
     """
-    # Create a copy to avoid modifying the original
-    result = df.copy()
-    
-    # For numeric columns, replace NaN with 0
-    numeric_columns = result.select_dtypes(include=['number']).columns
-    result[numeric_columns] = result[numeric_columns].fillna(0)
+    # Shallow copy; the filled columns below are new arrays, so the original
+    # is not modified
+    result = df.copy(deep=False)
     
-    # For string columns, replace NaN with empty string
-    string_columns = result.select_dtypes(include=['object']).columns
-    result[string_columns] = result[string_columns].fillna('')
+    # Replace NaN with 0 in numeric columns and with an empty string in string
+    # columns, replacing only the columns that have missing values (DataFrame.fillna
+    # with a dict would deep-copy the frame, or fill the shared arrays in place)
+    fill_values = dict.fromkeys(result.select_dtypes(include=['number']).columns, 0)
+    fill_values.update(dict.fromkeys(result.select_dtypes(include=['object']).columns, ''))
+    for column, value in fill_values.items():
+        if result[column].hasnans:
+            result[column] = result[column].fillna(value)
     
     return result
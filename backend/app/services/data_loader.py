@@ -4,12 +4,47 @@ Data loading utilities for Watchdog AI.
 This module handles loading and initial validation of CSV files.
 """
 import pandas as pd
+import numpy as np
+import codecs
+import csv
+import io
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
+import re
+import weakref
 
 logger = logging.getLogger("watchdog.data_loader")
 
+# Number of bytes read from the start of a CSV file to infer its encoding and delimiter
+SNIFF_SIZE = 8192
+
+# Encoding assumed for CSV files that are not UTF-8 (the Windows default used
+# by Excel exports)
+FALLBACK_ENCODING = 'cp1252'
+
+# Delimiters recognized in CSV files, in order of preference
+DELIMITERS = [',', ';', '\t', '|']
+
+# Quoted fields, whose delimiters and line breaks are not part of the layout
+_QUOTED_FIELD = re.compile(r'"[^"]*"')
+
+# Number of rows used to infer column types
+TYPE_SAMPLE_SIZE = 10_000
+
+# Start of a numeric date such as 2024-01-31 or 01/31/2024
+_DATE_PREFIX = re.compile(r'\d{1,4}[-/]\d{1,2}[-/]\d{1,4}')
+
+# Columns that indicate the simple dealership data format (from watchdog test data.csv)
+SIMPLE_FORMAT_COLUMNS = frozenset({"lead_source", "listing_price", "sold_price", "profit", "sales_rep_name"})
+
+# Columns that indicate the detailed dealership data format (from ROI Calc - Sold Log.csv)
+DETAILED_FORMAT_COLUMNS = frozenset({"globalcustomerid", "autoleadid", "soldstatus", "solddate", "leadsource"})
+
+# Inferred column types by DataFrame id, with the frame's shape, columns and
+# dtypes when they were inferred (entries are dropped when the frame is freed)
+_COLUMN_TYPES: Dict[int, Tuple[Tuple, Dict[str, str]]] = {}
+
 def load_csv_file(file_path: str) -> pd.DataFrame:
     """
     Load a CSV file and perform initial validation.
@@ -27,20 +62,27 @@ def load_csv_file(file_path: str) -> pd.DataFrame:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    logger.info(f"Loading CSV file: {file_path}")
+    logger.info("Loading CSV file: %s", file_path)
     
     try:
-        # Try to infer the delimiter
-        with open(file_path, 'r', encoding='utf-8') as f:
-            sample = f.read(4096)
+        # Try to infer the encoding and delimiter from the start of the file
+        with open(file_path, 'rb') as f:
+            raw = f.read(SNIFF_SIZE)
+        encoding = sniff_encoding(raw)
+        sample = raw.decode(encoding, errors='ignore')
+        delimiter = sniff_delimiter(sample, truncated=len(raw) == SNIFF_SIZE)
         
-        # Count occurrences of common delimiters
-        delimiters = [',', ';', '\t', '|']
-        counts = {d: sample.count(d) for d in delimiters}
-        delimiter = max(counts, key=counts.get)
+        # Check the header before parsing, so files without enough columns are
+        # rejected without reading them in full
+        header = next((row for row in csv.reader(io.StringIO(sample), delimiter=delimiter) if row), None)
+        if header is None:
+            raise ValueError("The CSV file is empty")
+        
+        if len(header) < 2:
+            raise ValueError("The CSV file must have at least two columns")
         
         # Load the CSV with the inferred delimiter
-        df = pd.read_csv(file_path, delimiter=delimiter)
+        df = pd.read_csv(file_path, delimiter=delimiter, encoding=encoding, encoding_errors='replace')
         
         # Basic validation
         if df.empty:
@@ -49,58 +91,189 @@ def load_csv_file(file_path: str) -> pd.DataFrame:
         if len(df.columns) < 2:
             raise ValueError("The CSV file must have at least two columns")
         
-        logger.info(f"Successfully loaded CSV with {len(df)} rows and {len(df.columns)} columns")
+        logger.info("Successfully loaded CSV with %s rows and %s columns", len(df), len(df.columns))
         
         return df
     
     except pd.errors.ParserError as e:
-        logger.error(f"Error parsing CSV file: {e}")
+        logger.error("Error parsing CSV file: %s", e)
         raise ValueError(f"Invalid CSV format: {str(e)}")
     
     except Exception as e:
-        logger.error(f"Unexpected error loading CSV: {e}")
+        logger.error("Unexpected error loading CSV: %s", e)
         raise
 
+def sniff_encoding(raw: bytes) -> str:
+    """
+    Infer the encoding of a CSV file from the start of its bytes.
+    
+    Args:
+        raw: Bytes from the start of the file
+        
+    Returns:
+        'utf-8-sig' if the file starts with a UTF-8 byte order mark, 'utf-8'
+        if the bytes are valid UTF-8, and FALLBACK_ENCODING otherwise
+    """
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    
+    try:
+        # Decode incrementally, so a character cut off at the end of the
+        # sample is not mistaken for invalid UTF-8
+        codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+def sniff_delimiter(sample: str, truncated: bool = False) -> str:
+    """
+    Infer the delimiter of a CSV file from the start of its text.
+    
+    Quoted fields are ignored, and the delimiter that splits up to the first
+    10 lines into the same, largest number of columns is chosen. If no
+    delimiter splits the lines evenly, the most frequent one is used.
+    
+    Args:
+        sample: Text from the start of the file
+        truncated: Whether the sample ends partway through the file (its
+            last line may then be incomplete and is not checked)
+        
+    Returns:
+        The inferred delimiter
+    """
+    unquoted = _QUOTED_FIELD.sub('', sample)
+    lines = [line for line in unquoted.splitlines() if line.strip()]
+    if truncated and len(lines) > 1:
+        lines.pop()
+    lines = lines[:10]
+    
+    delimiter, columns = None, 1
+    for candidate in DELIMITERS:
+        counts = {line.count(candidate) for line in lines}
+        if len(counts) == 1:
+            width = counts.pop() + 1
+            if width > columns:
+                delimiter, columns = candidate, width
+    
+    if delimiter is None:
+        # Fall back to the delimiter that occurs most often
+        counts = {d: unquoted.count(d) for d in DELIMITERS}
+        delimiter = max(counts, key=counts.get)
+    
+    return delimiter
+
+def save_processed_data(df: pd.DataFrame, file_path: str) -> None:
+    """
+    Save a cleaned DataFrame for later analysis.
+    
+    The frame is pickled rather than written back to CSV so that reloading it
+    skips text parsing and keeps the dtypes produced by cleaning.
+    
+    Args:
+        df: Cleaned DataFrame
+        file_path: Destination path
+    """
+    df.to_pickle(file_path)
+
+def load_processed_data(file_path: str) -> pd.DataFrame:
+    """
+    Load a DataFrame saved by save_processed_data.
+    
+    Only use this for files the application wrote itself; unpickling
+    untrusted input is unsafe.
+    
+    Args:
+        file_path: Path to the processed file
+        
+    Returns:
+        The cleaned DataFrame
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    return pd.read_pickle(file_path)
+
 def get_column_types(df: pd.DataFrame) -> Dict[str, str]:
     """
     Determine the data type of each column in the DataFrame.
     
+    Types are inferred from the first TYPE_SAMPLE_SIZE rows, so classifying
+    a large frame doesn't scan every value, and are cached for the frame until
+    its shape, columns or dtypes change.
+    
     Args:
         df: DataFrame to analyze
         
     Returns:
         Dictionary mapping column names to data types
     """
+    signature = (df.shape, tuple(df.columns), tuple(df.dtypes))
+    cached = _COLUMN_TYPES.get(id(df))
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    
     column_types = {}
+    rows = df.head(TYPE_SAMPLE_SIZE)
     
     for column in df.columns:
         # Check if column contains numeric values
-        if pd.api.types.is_numeric_dtype(df[column]):
+        if pd.api.types.is_numeric_dtype(rows[column]):
             # Check if it's an integer or float
-            if df[column].dropna().apply(lambda x: x == int(x)).all():
+            if is_whole_number(rows[column]):
                 column_types[column] = "integer"
             else:
                 column_types[column] = "float"
         
         # Check if column contains datetime values
-        elif pd.api.types.is_datetime64_dtype(df[column]):
+        elif pd.api.types.is_datetime64_dtype(rows[column]):
             column_types[column] = "datetime"
         
         # Check if column might be a date string
-        elif df[column].dtype == 'object':
+        elif rows[column].dtype == 'object':
             # Sample non-null values
-            sample = df[column].dropna().head(10)
-            try:
-                pd.to_datetime(sample)
-                column_types[column] = "date_string"
-            except:
+            sample = rows[column].dropna().head(10)
+            
+            # Only try to parse samples that start with a numeric date, as
+            # pd.to_datetime is slow to fail on text
+            if len(sample) and not _DATE_PREFIX.match(str(sample.iloc[0])):
                 column_types[column] = "string"
+            else:
+                try:
+                    pd.to_datetime(sample)
+                    column_types[column] = "date_string"
+                except:
+                    column_types[column] = "string"
         
         # Default to string
         else:
             column_types[column] = "string"
     
-    return column_types
+    if id(df) not in _COLUMN_TYPES:
+        weakref.finalize(df, _COLUMN_TYPES.pop, id(df), None)
+    _COLUMN_TYPES[id(df)] = (signature, column_types)
+    
+    return dict(column_types)
+
+def is_whole_number(series: pd.Series) -> bool:
+    """
+    Check whether every non-null value of a numeric series is a whole number.
+    
+    Args:
+        series: Numeric series to check
+        
+    Returns:
+        True if all non-null values are whole numbers
+    """
+    # Integer and boolean columns can only hold whole numbers
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return True
+    
+    # Check all values at once (infinities are not whole numbers)
+    values = series.dropna().to_numpy(dtype=float)
+    return bool(np.all(np.isfinite(values) & (np.floor(values) == values)))
 
 def get_column_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
     """
@@ -116,32 +289,47 @@ def get_column_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
     column_types = get_column_types(df)
     
     for column in df.columns:
+        # Find missing values once; the other statistics are computed over the
+        # remaining values, so each reduction skips its own NaN check
+        series = df[column]
+        missing = series.isna()
+        missing_count = missing.sum()
+        values = series[~missing]
+        
         column_stats = {
             "type": column_types[column],
-            "missing_count": df[column].isna().sum(),
-            "missing_percentage": round(df[column].isna().mean() * 100, 2),
-            "unique_count": df[column].nunique()
+            "missing_count": missing_count,
+            "missing_percentage": round(missing_count / len(series) * 100, 2) if len(series) else np.nan,
+            "unique_count": values.nunique(dropna=False)
         }
         
         # Add type-specific statistics
         if column_types[column] in ["integer", "float"]:
-            numeric_stats = {
-                "min": df[column].min() if not df[column].empty else None,
-                "max": df[column].max() if not df[column].empty else None,
-                "mean": df[column].mean() if not df[column].empty else None,
-                "median": df[column].median() if not df[column].empty else None,
-                "std": df[column].std() if not df[column].empty else None
-            }
+            if series.empty:
+                numeric_stats = dict.fromkeys(["min", "max", "mean", "median", "std"])
+            else:
+                numeric_stats = {
+                    "min": values.min(skipna=False),
+                    "max": values.max(skipna=False),
+                    "mean": values.mean(skipna=False),
+                    "median": values.median(skipna=False),
+                    "std": values.std(skipna=False)
+                }
             column_stats.update(numeric_stats)
         
         elif column_types[column] in ["date_string", "datetime"]:
             try:
-                date_series = pd.to_datetime(df[column])
-                date_stats = {
-                    "min_date": date_series.min().strftime("%Y-%m-%d") if not date_series.empty else None,
-                    "max_date": date_series.max().strftime("%Y-%m-%d") if not date_series.empty else None,
-                    "date_range_days": (date_series.max() - date_series.min()).days if not date_series.empty else None
-                }
+                date_series = pd.to_datetime(series)
+                if date_series.empty:
+                    date_stats = dict.fromkeys(["min_date", "max_date", "date_range_days"])
+                else:
+                    # Find the earliest and latest dates once for all three statistics
+                    first, last = date_series.min(), date_series.max()
+                    date_stats = {
+                        "min_date": first.strftime("%Y-%m-%d"),
+                        "max_date": last.strftime("%Y-%m-%d"),
+                        "date_range_days": (last - first).days
+                    }
                 column_stats.update(date_stats)
             except:
                 # If conversion fails, skip date-specific stats
@@ -167,17 +355,11 @@ def detect_dealership_data_format(df: pd.DataFrame) -> str:
         String indicating the detected format: "simple", "detailed", or "unknown"
     """
     # Check column names to determine format
-    columns = set(df.columns.str.lower())
-    
-    # Simple format indicators (from watchdog test data.csv)
-    simple_indicators = {"lead_source", "listing_price", "sold_price", "profit", "sales_rep_name"}
-    
-    # Detailed format indicators (from ROI Calc - Sold Log.csv)
-    detailed_indicators = {"globalcustomerid", "autoleadid", "soldstatus", "solddate", "leadsource"}
+    columns = {str(column).lower() for column in df.columns}
     
     # Check for matches
-    simple_match = len(simple_indicators.intersection(columns)) / len(simple_indicators)
-    detailed_match = len(detailed_indicators.intersection(columns)) / len(detailed_indicators)
+    simple_match = len(SIMPLE_FORMAT_COLUMNS & columns) / len(SIMPLE_FORMAT_COLUMNS)
+    detailed_match = len(DETAILED_FORMAT_COLUMNS & columns) / len(DETAILED_FORMAT_COLUMNS)
     
     if simple_match > 0.6:
         return "simple"
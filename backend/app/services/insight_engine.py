@@ -4,12 +4,102 @@ Insight engine for Watchdog AI.
 This module generates insights and answers questions based on analysis results.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List
 import re
-import random
+from functools import lru_cache
+from itertools import chain
+from operator import methodcaller
+
+from app.services.analyzer import analyze_data
 
 logger = logging.getLogger("watchdog.insight_engine")
 
+# Question keyword classes, one bit each. Answer generators test the bits of
+# _question_flags(question) instead of running one regex per class.
+(
+    _Q_TOP, _Q_REP, _Q_VEHICLE, _Q_SOURCE, _Q_TOTAL, _Q_AVERAGE, _Q_MARGIN,
+    _Q_RANKING, _Q_ROI, _Q_COMPARE, _Q_MAKE, _Q_MODEL, _Q_SPEED, _Q_SUMMARY,
+) = (1 << bit for bit in range(14))
+
+_QUESTION_KEYWORDS = [
+    (_Q_TOP, ['highest', 'top', 'best', 'most']),
+    (_Q_REP, [r'sales\s*rep', 'salesperson', 'representative']),
+    (_Q_VEHICLE, ['vehicle', 'car', 'model', 'make']),
+    (_Q_SOURCE, [r'lead\s*source', 'source', 'marketing']),
+    (_Q_TOTAL, ['total', 'overall']),
+    (_Q_AVERAGE, ['average', 'mean']),
+    (_Q_MARGIN, ['margin']),
+    (_Q_RANKING, ['leaderboard', 'ranking', 'rank', 'compare']),
+    (_Q_ROI, ['roi', 'return', 'investment']),
+    (_Q_COMPARE, ['compare', 'comparison']),
+    (_Q_MAKE, ['make', 'brand']),
+    (_Q_MODEL, ['model']),
+    (_Q_SPEED, ['fast', 'quick', 'days']),
+    (_Q_SUMMARY, ['summary', 'overview']),
+]
+
+def _build_question_scan():
+    """Compile the single-pass keyword scan and its keyword -> class-bits table."""
+    base_flags: Dict[str, int] = {}
+    for flag, terms in _QUESTION_KEYWORDS:
+        for term in terms:
+            key = term.replace(r'\s*', '')
+            base_flags[key] = base_flags.get(key, 0) | flag
+    
+    # Only the longest keyword at each start position is captured, so every keyword
+    # also carries the bits of the keywords it contains (e.g. 'ranking' -> 'rank')
+    keyword_flags = {}
+    for key in base_flags:
+        flags = 0
+        for other, flag in base_flags.items():
+            if other in key:
+                flags |= flag
+        keyword_flags[key] = flags
+    
+    terms = sorted(
+        {term for _, group in _QUESTION_KEYWORDS for term in group},
+        key=lambda term: len(term.replace(r'\s*', '')),
+        reverse=True,
+    )
+    # Zero-width lookahead so overlapping keywords at later positions are still seen
+    scan = re.compile("(?=(" + "|".join(terms) + "))")
+    return scan, keyword_flags
+
+_QUESTION_SCAN, _KEYWORD_FLAGS = _build_question_scan()
+_WHITESPACE = re.compile(r'\s+')
+
+def _question_flags(question: str) -> int:
+    """Return the keyword-class bits present in a (lowercased) question."""
+    flags = 0
+    for match in _QUESTION_SCAN.finditer(question):
+        flags |= _KEYWORD_FLAGS[_WHITESPACE.sub('', match.group(1))]
+    return flags
+
+# C-level sort key for picking entries out of metric lists; metrics may lack a
+# key when the source column is missing, hence dict.get with a default
+_AVERAGE_PROFIT = methodcaller("get", "average_profit", 0)
+
+# Top-3 leaderboard answer: the kind of entity, then name/profit pairs in rank order
+_TOP3_ANSWER = "Your top 3 {} by profit are: 1. {} with {}, 2. {} with {}, and 3. {} with {}."
+
+# Intent keywords in priority order (substring matches, no word boundaries)
+_INTENT_KEYWORDS = [
+    ("sales_analysis", ['sales', 'revenue', 'sold', 'selling', 'sell']),
+    ("profit_analysis", ['profit', 'margin', 'profitable', 'earnings', 'money']),
+    ("rep_performance", ['rep', 'representative', 'salesperson', 'sales person', 'team']),
+    ("lead_source_analysis", ['lead', 'source', 'marketing', 'advertisement', 'campaign']),
+    ("vehicle_analysis", ['vehicle', 'car', 'make', 'model', 'brand']),
+]
+_INTENT_PRIORITY = {intent: rank for rank, (intent, _) in enumerate(_INTENT_KEYWORDS)}
+
+# All keywords in one pattern, scanned in a single pass. The zero-width lookahead
+# tries every start position so overlapping keywords are not skipped, and the
+# groups are ordered by priority so each position reports its highest-priority hit
+_INTENT_SCAN = re.compile("(?=(?:" + "|".join(
+    f"(?P<{intent}>" + "|".join(map(re.escape, terms)) + ")"
+    for intent, terms in _INTENT_KEYWORDS
+) + "))")
+
 def generate_insights(analysis_results: Dict[str, Any], intent: str) -> List[Dict[str, Any]]:
     """
     Generate insights based on analysis results.
@@ -21,26 +111,15 @@ def generate_insights(analysis_results: Dict[str, Any], intent: str) -> List[Dic
     Returns:
         List of insight items
     """
-    logger.info(f"Generating insights for intent: {intent}")
+    logger.info("Generating insights for intent: %s", intent)
     
-    insights = []
-    
-    # Generate insights based on intent
-    if intent == "sales_analysis":
-        insights.extend(generate_sales_insights(analysis_results))
-    elif intent == "profit_analysis":
-        insights.extend(generate_profit_insights(analysis_results))
-    elif intent == "rep_performance":
-        insights.extend(generate_rep_insights(analysis_results))
-    elif intent == "lead_source_analysis":
-        insights.extend(generate_lead_source_insights(analysis_results))
-    elif intent == "vehicle_analysis":
-        insights.extend(generate_vehicle_insights(analysis_results))
-    else:
-        # General analysis
-        insights.extend(generate_general_insights(analysis_results))
+    # Nothing to report on; skip the per-section lookups entirely
+    if not analysis_results:
+        return []
     
-    return insights
+    # Unknown intents fall back to general analysis
+    handler = _INSIGHT_DISPATCH.get(intent, generate_general_insights)
+    return handler(analysis_results)
 
 def generate_general_insights(analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -61,7 +140,7 @@ def generate_general_insights(analysis_results: Dict[str, Any]) -> List[Dict[str
         total_profit = format_currency(summary.get("total_profit", 0))
         average_profit = format_currency(summary.get("average_profit", 0))
         
-        date_range = summary.get("date_range", {})
+        date_range = summary.get("date_range") or {}
         date_text = ""
         if date_range:
             start = date_range.get("start", "")
@@ -83,24 +162,26 @@ def generate_general_insights(analysis_results: Dict[str, Any]) -> List[Dict[str
     
     # Add top metrics insights
     top_metrics = analysis_results.get("top_metrics", [])
-    for metric in top_metrics:
-        title = metric.get("title", "")
-        value = metric.get("value", "")
-        metric_value = metric.get("metric", "")
-        description = metric.get("description", "")
-        
-        insights.append({
-            "title": title,
-            "description": description,
-            "employee": value,
-            "employeeTitle": title.lower(),
-            "amount": metric_value,
-            "percentage": None,
-            "actionItems": generate_action_items_for_metric(title, value, metric_value)
-        })
+    insights.extend(_top_metric_insight(metric) for metric in top_metrics)
     
     return insights
 
+def _top_metric_insight(metric: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the insight item for a single top metric."""
+    title = metric.get("title", "")
+    value = metric.get("value", "")
+    metric_value = metric.get("metric", "")
+    
+    return {
+        "title": title,
+        "description": metric.get("description", ""),
+        "employee": value,
+        "employeeTitle": title.lower(),
+        "amount": metric_value,
+        "percentage": None,
+        "actionItems": generate_action_items_for_metric(title, value, metric_value)
+    }
+
 def generate_sales_insights(analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Generate insights for sales analysis.
@@ -118,11 +199,18 @@ def generate_sales_insights(analysis_results: Dict[str, Any]) -> List[Dict[str,
     if summary:
         total_sales = format_currency(summary.get("total_sales", 0))
         average_sale = format_currency(summary.get("average_sale_price", 0))
-        highest_sale = summary.get("highest_sale", {})
+        highest_sale = summary.get("highest_sale") or {}
         
         highest_sale_price = format_currency(highest_sale.get("price", 0)) if highest_sale else ""
-        highest_sale_vehicle = highest_sale.get("vehicle", "") if highest_sale else ""
-        highest_sale_rep = highest_sale.get("sales_rep", "") if highest_sale else ""
+        highest_sale_vehicle = highest_sale.get("vehicle", "")
+        highest_sale_rep = highest_sale.get("sales_rep", "")
+        
+        highest_sale_parts = [f"Your highest sale was {highest_sale_price}"]
+        if highest_sale_vehicle:
+            highest_sale_parts.append(f" for a {highest_sale_vehicle}")
+        if highest_sale_rep:
+            highest_sale_parts.append(f" by {highest_sale_rep}")
+        highest_sale_parts.append(".")
         
         insights.append({
             "title": "Sales Performance",
@@ -130,7 +218,7 @@ def generate_sales_insights(analysis_results: Dict[str, Any]) -> List[Dict[str,
             "amount": total_sales,
             "percentage": None,
             "actionItems": [
-                f"Your highest sale was {highest_sale_price}" + (f" for a {highest_sale_vehicle}" if highest_sale_vehicle else "") + (f" by {highest_sale_rep}" if highest_sale_rep else "") + ".",
+                "".join(highest_sale_parts),
                 "Focus on high-value vehicles to increase average sale price."
             ]
         })
@@ -197,9 +285,14 @@ def generate_profit_insights(analysis_results: Dict[str, Any]) -> List[Dict[str,
         profit_margin = summary.get("profit_margin", 0)
         profit_margin_formatted = f"{profit_margin:.1f}%" if profit_margin is not None else ""
         
-        highest_profit_sale = summary.get("highest_profit_sale", {})
+        highest_profit_sale = summary.get("highest_profit_sale") or {}
         highest_profit = format_currency(highest_profit_sale.get("profit", 0)) if highest_profit_sale else ""
-        highest_profit_vehicle = highest_profit_sale.get("vehicle", "") if highest_profit_sale else ""
+        highest_profit_vehicle = highest_profit_sale.get("vehicle", "")
+        
+        highest_profit_parts = [f"Your highest profit sale was {highest_profit}"]
+        if highest_profit_vehicle:
+            highest_profit_parts.append(f" for a {highest_profit_vehicle}")
+        highest_profit_parts.append(".")
         
         insights.append({
             "title": "Profit Performance",
@@ -207,7 +300,7 @@ def generate_profit_insights(analysis_results: Dict[str, Any]) -> List[Dict[str,
             "amount": total_profit,
             "percentage": profit_margin_formatted,
             "actionItems": [
-                f"Your highest profit sale was {highest_profit}" + (f" for a {highest_profit_vehicle}" if highest_profit_vehicle else "") + ".",
+                "".join(highest_profit_parts),
                 "Focus on high-margin vehicles to increase overall profitability."
             ]
         })
@@ -272,8 +365,8 @@ def generate_rep_insights(analysis_results: Dict[str, Any]) -> List[Dict[str, An
         total_reps = summary.get("total_reps", 0)
         average_profit = format_currency(summary.get("average_profit_per_rep", 0))
         
-        top_rep = summary.get("top_rep", {})
-        top_rep_name = top_rep.get("name", "") if top_rep else ""
+        top_rep = summary.get("top_rep") or {}
+        top_rep_name = top_rep.get("name", "")
         top_rep_profit = format_currency(top_rep.get("total_profit", 0)) if top_rep else ""
         
         insights.append({
@@ -290,10 +383,10 @@ def generate_rep_insights(analysis_results: Dict[str, Any]) -> List[Dict[str, An
     # Add rep leaderboard insight
     rep_leaderboard = analysis_results.get("rep_leaderboard", [])
     if rep_leaderboard and len(rep_leaderboard) >= 3:
-        top_reps = rep_leaderboard[:3]
-        
-        rep_names = [rep.get("name", "") for rep in top_reps]
-        rep_profits = [format_currency(rep.get("total_profit", 0)) for rep in top_reps]
+        rep_names, rep_profits = zip(*(
+            (rep.get("name", ""), format_currency(rep.get("total_profit", 0)))
+            for rep in rep_leaderboard[:3]
+        ))
         
         insights.append({
             "title": "Sales Rep Leaderboard",
@@ -312,7 +405,7 @@ def generate_rep_insights(analysis_results: Dict[str, Any]) -> List[Dict[str, An
     rep_metrics = analysis_results.get("rep_metrics", [])
     if rep_metrics and len(rep_metrics) > 0:
         # Find rep with highest average profit
-        highest_avg_rep = max(rep_metrics, key=lambda x: x.get("average_profit", 0), default={})
+        highest_avg_rep = max(rep_metrics, key=_AVERAGE_PROFIT, default={})
         rep_name = highest_avg_rep.get("name", "")
         rep_average = format_currency(highest_avg_rep.get("average_profit", 0))
         rep_count = highest_avg_rep.get("sale_count", 0)
@@ -350,8 +443,8 @@ def generate_lead_source_insights(analysis_results: Dict[str, Any]) -> List[Dict
         total_sources = summary.get("total_sources", 0)
         average_profit = format_currency(summary.get("average_profit_per_source", 0))
         
-        top_source = summary.get("top_source", {})
-        top_source_name = top_source.get("name", "") if top_source else ""
+        top_source = summary.get("top_source") or {}
+        top_source_name = top_source.get("name", "")
         top_source_profit = format_currency(top_source.get("total_profit", 0)) if top_source else ""
         
         insights.append({
@@ -366,10 +459,8 @@ def generate_lead_source_insights(analysis_results: Dict[str, Any]) -> List[Dict
         })
     
     # Add source ROI insight
-    source_roi = analysis_results.get("source_roi", [])
-    if source_roi and len(source_roi) > 0:
-        # Find source with highest ROI
-        highest_roi_source = max(source_roi, key=lambda x: x.get("roi", 0), default={})
+    highest_roi_source = analysis_results.get("top_roi") or {}
+    if highest_roi_source:
         source_name = highest_roi_source.get("name", "")
         source_roi_value = highest_roi_source.get("roi", 0)
         source_roi_formatted = f"{source_roi_value:.1f}%" if source_roi_value is not None else ""
@@ -390,7 +481,7 @@ def generate_lead_source_insights(analysis_results: Dict[str, Any]) -> List[Dict
     source_metrics = analysis_results.get("source_metrics", [])
     if source_metrics and len(source_metrics) > 0:
         # Find source with highest average profit
-        highest_avg_source = max(source_metrics, key=lambda x: x.get("average_profit", 0), default={})
+        highest_avg_source = max(source_metrics, key=_AVERAGE_PROFIT, default={})
         source_name = highest_avg_source.get("name", "")
         source_average = format_currency(highest_avg_source.get("average_profit", 0))
         source_count = highest_avg_source.get("sale_count", 0)
@@ -427,12 +518,12 @@ def generate_vehicle_insights(analysis_results: Dict[str, Any]) -> List[Dict[str
         avg_days = summary.get("average_days_to_sell", 0)
         avg_days_formatted = f"{avg_days:.1f}" if avg_days is not None else ""
         
-        top_make = summary.get("top_make", {})
-        top_make_name = top_make.get("name", "") if top_make else ""
+        top_make = summary.get("top_make") or {}
+        top_make_name = top_make.get("name", "")
         top_make_profit = format_currency(top_make.get("total_profit", 0)) if top_make else ""
         
-        top_model = summary.get("top_model", {})
-        top_model_name = top_model.get("name", "") if top_model else ""
+        top_model = summary.get("top_model") or {}
+        top_model_name = top_model.get("name", "")
         
         insights.append({
             "title": "Vehicle Sales Performance",
@@ -484,10 +575,8 @@ def generate_vehicle_insights(analysis_results: Dict[str, Any]) -> List[Dict[str
         })
     
     # Add vehicle metrics insight
-    vehicle_metrics = analysis_results.get("vehicle_metrics", [])
-    if vehicle_metrics and len(vehicle_metrics) > 0:
-        # Find vehicle with fastest sales
-        fastest_selling = min(vehicle_metrics, key=lambda x: x.get("average_days_to_sell", float('inf')), default={})
+    fastest_selling = analysis_results.get("fastest_vehicle") or {}
+    if fastest_selling:
         if "average_days_to_sell" in fastest_selling:
             vehicle_type = fastest_selling.get("type", "")
             days_to_sell = fastest_selling.get("average_days_to_sell", 0)
@@ -506,6 +595,14 @@ def generate_vehicle_insights(analysis_results: Dict[str, Any]) -> List[Dict[str
     
     return insights
 
+_INSIGHT_DISPATCH: Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = {
+    "sales_analysis": generate_sales_insights,
+    "profit_analysis": generate_profit_insights,
+    "rep_performance": generate_rep_insights,
+    "lead_source_analysis": generate_lead_source_insights,
+    "vehicle_analysis": generate_vehicle_insights,
+}
+
 def answer_question(df, question: str) -> Dict[str, Any]:
     """
     Answer a specific question about the data.
@@ -517,7 +614,7 @@ def answer_question(df, question: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the answer, insights, and chart data
     """
-    logger.info(f"Answering question: {question}")
+    logger.info("Answering question: %s", question)
     
     # Normalize question
     normalized_question = question.lower().strip()
@@ -526,7 +623,6 @@ def answer_question(df, question: str) -> Dict[str, Any]:
     intent = determine_intent(normalized_question)
     
     # Analyze data based on intent
-    from app.services.analyzer import analyze_data
     analysis_results = analyze_data(df, intent)
     
     # Generate insights
@@ -552,28 +648,16 @@ def determine_intent(question: str) -> str:
     Returns:
         Intent string
     """
-    # Check for sales-related questions
-    if any(term in question for term in ['sales', 'revenue', 'sold', 'selling', 'sell']):
-        return "sales_analysis"
-    
-    # Check for profit-related questions
-    if any(term in question for term in ['profit', 'margin', 'profitable', 'earnings', 'money']):
-        return "profit_analysis"
-    
-    # Check for rep-related questions
-    if any(term in question for term in ['rep', 'representative', 'salesperson', 'sales person', 'team']):
-        return "rep_performance"
-    
-    # Check for lead source-related questions
-    if any(term in question for term in ['lead', 'source', 'marketing', 'advertisement', 'campaign']):
-        return "lead_source_analysis"
-    
-    # Check for vehicle-related questions
-    if any(term in question for term in ['vehicle', 'car', 'make', 'model', 'brand']):
-        return "vehicle_analysis"
+    best = None
+    for match in _INTENT_SCAN.finditer(question):
+        intent = match.lastgroup
+        if best is None or _INTENT_PRIORITY[intent] < _INTENT_PRIORITY[best]:
+            best = intent
+            if _INTENT_PRIORITY[best] == 0:
+                break
     
     # Default to general analysis
-    return "general_analysis"
+    return best or "general_analysis"
 
 def generate_answer_text(question: str, analysis_results: Dict[str, Any], intent: str) -> str:
     """
@@ -587,19 +671,8 @@ def generate_answer_text(question: str, analysis_results: Dict[str, Any], intent
     Returns:
         Answer text
     """
-    # Extract key information based on intent
-    if intent == "sales_analysis":
-        return generate_sales_answer(question, analysis_results)
-    elif intent == "profit_analysis":
-        return generate_profit_answer(question, analysis_results)
-    elif intent == "rep_performance":
-        return generate_rep_answer(question, analysis_results)
-    elif intent == "lead_source_analysis":
-        return generate_lead_source_answer(question, analysis_results)
-    elif intent == "vehicle_analysis":
-        return generate_vehicle_answer(question, analysis_results)
-    else:
-        return generate_general_answer(question, analysis_results)
+    handler = _ANSWER_DISPATCH.get(intent, generate_general_answer)
+    return handler(question, analysis_results)
 
 def generate_sales_answer(question: str, analysis_results: Dict[str, Any]) -> str:
     """
@@ -617,8 +690,9 @@ def generate_sales_answer(question: str, analysis_results: Dict[str, Any]) -> st
     average_sale = format_currency(summary.get("average_sale_price", 0))
     
     # Check for specific question patterns
-    if re.search(r'highest|top|best|most', question):
-        if re.search(r'(sales\s*rep|salesperson|representative)', question):
+    flags = _question_flags(question)
+    if flags & _Q_TOP:
+        if flags & _Q_REP:
             # Question about top sales rep
             sales_by_rep = analysis_results.get("sales_by_rep", [])
             if sales_by_rep and len(sales_by_rep) > 0:
@@ -629,7 +703,7 @@ def generate_sales_answer(question: str, analysis_results: Dict[str, Any]) -> st
                 
                 return f"Your top sales representative is {rep_name} with {rep_sales} in total sales. They completed {rep_count} sales with an average of {format_currency(top_rep.get('average_sale', 0))} per sale."
         
-        if re.search(r'(vehicle|car|model|make)', question):
+        if flags & _Q_VEHICLE:
             # Question about top vehicle
             sales_by_vehicle = analysis_results.get("sales_by_vehicle_type", [])
             if sales_by_vehicle and len(sales_by_vehicle) > 0:
@@ -640,10 +714,10 @@ def generate_sales_answer(question: str, analysis_results: Dict[str, Any]) -> st
                 
                 return f"Your top selling vehicle is the {vehicle_type} with {vehicle_sales} in total sales. You sold {vehicle_count} units with an average price of {format_currency(top_vehicle.get('average_sale', 0))} per vehicle."
     
-    if re.search(r'total|overall', question):
+    if flags & _Q_TOTAL:
         return f"Your dealership generated {total_sales} in total sales. The average sale price was {average_sale}."
     
-    if re.search(r'average|mean', question):
+    if flags & _Q_AVERAGE:
         return f"The average sale price at your dealership is {average_sale}."
     
     # Default answer
@@ -667,8 +741,9 @@ def generate_profit_answer(question: str, analysis_results: Dict[str, Any]) -> s
     profit_margin_formatted = f"{profit_margin:.1f}%" if profit_margin is not None else ""
     
     # Check for specific question patterns
-    if re.search(r'highest|top|best|most', question):
-        if re.search(r'(sales\s*rep|salesperson|representative)', question):
+    flags = _question_flags(question)
+    if flags & _Q_TOP:
+        if flags & _Q_REP:
             # Question about top profit rep
             profit_by_rep = analysis_results.get("profit_by_rep", [])
             if profit_by_rep and len(profit_by_rep) > 0:
@@ -679,7 +754,7 @@ def generate_profit_answer(question: str, analysis_results: Dict[str, Any]) -> s
                 
                 return f"Your top profit-generating sales representative is {rep_name} with {rep_profit} in total profit. Their average profit per sale is {rep_average}."
         
-        if re.search(r'(lead\s*source|source|marketing)', question):
+        if flags & _Q_SOURCE:
             # Question about top lead source
             profit_by_source = analysis_results.get("profit_by_lead_source", [])
             if profit_by_source and len(profit_by_source) > 0:
@@ -690,7 +765,7 @@ def generate_profit_answer(question: str, analysis_results: Dict[str, Any]) -> s
                 
                 return f"Your most profitable lead source is {source_name} with {source_profit} in total profit. The average profit per sale from this source is {source_average}."
         
-        if re.search(r'(vehicle|car|model|make)', question):
+        if flags & _Q_VEHICLE:
             # Question about top vehicle
             profit_by_vehicle = analysis_results.get("profit_by_vehicle_type", [])
             if profit_by_vehicle and len(profit_by_vehicle) > 0:
@@ -701,13 +776,13 @@ def generate_profit_answer(question: str, analysis_results: Dict[str, Any]) -> s
                 
                 return f"Your most profitable vehicle is the {vehicle_type} with {vehicle_profit} in total profit. The average profit per sale for this vehicle is {vehicle_average}."
     
-    if re.search(r'total|overall', question):
+    if flags & _Q_TOTAL:
         return f"Your dealership generated {total_profit} in total profit with an overall profit margin of {profit_margin_formatted}."
     
-    if re.search(r'average|mean', question):
+    if flags & _Q_AVERAGE:
         return f"The average profit per sale at your dealership is {average_profit}."
     
-    if re.search(r'margin', question):
+    if flags & _Q_MARGIN:
         return f"Your dealership's overall profit margin is {profit_margin_formatted}."
     
     # Default answer
@@ -728,7 +803,8 @@ def generate_rep_answer(question: str, analysis_results: Dict[str, Any]) -> str:
     total_reps = summary.get("total_reps", 0)
     
     # Check for specific question patterns
-    if re.search(r'highest|top|best|most', question):
+    flags = _question_flags(question)
+    if flags & _Q_TOP:
         top_rep = summary.get("top_rep", {})
         if top_rep:
             rep_name = top_rep.get("name", "")
@@ -737,16 +813,15 @@ def generate_rep_answer(question: str, analysis_results: Dict[str, Any]) -> str:
             
             return f"Your top performing sales representative is {rep_name} with {rep_profit} in total profit from {rep_count} sales."
     
-    if re.search(r'leaderboard|ranking|rank|compare', question):
+    if flags & _Q_RANKING:
         rep_leaderboard = analysis_results.get("rep_leaderboard", [])
         if rep_leaderboard and len(rep_leaderboard) >= 3:
-            top_reps = rep_leaderboard[:3]
-            rep_names = [rep.get("name", "") for rep in top_reps]
-            rep_profits = [format_currency(rep.get("total_profit", 0)) for rep in top_reps]
-            
-            return f"Your top 3 sales representatives by profit are: 1. {rep_names[0]} with {rep_profits[0]}, 2. {rep_names[1]} with {rep_profits[1]}, and 3. {rep_names[2]} with {rep_profits[2]}."
+            return _TOP3_ANSWER.format("sales representatives", *chain.from_iterable(
+                (rep.get("name", ""), format_currency(rep.get("total_profit", 0)))
+                for rep in rep_leaderboard[:3]
+            ))
     
-    if re.search(r'average|mean', question):
+    if flags & _Q_AVERAGE:
         average_profit = format_currency(summary.get("average_profit_per_rep", 0))
         return f"The average profit generated per sales representative is {average_profit}."
     
@@ -768,12 +843,12 @@ def generate_lead_source_answer(question: str, analysis_results: Dict[str, Any])
     total_sources = summary.get("total_sources", 0)
     
     # Check for specific question patterns
-    if re.search(r'highest|top|best|most', question):
-        if re.search(r'roi|return|investment', question):
+    flags = _question_flags(question)
+    if flags & _Q_TOP:
+        if flags & _Q_ROI:
             # Question about highest ROI source
-            source_roi = analysis_results.get("source_roi", [])
-            if source_roi and len(source_roi) > 0:
-                highest_roi_source = max(source_roi, key=lambda x: x.get("roi", 0), default={})
+            highest_roi_source = analysis_results.get("top_roi") or {}
+            if highest_roi_source:
                 source_name = highest_roi_source.get("name", "")
                 source_roi_value = highest_roi_source.get("roi", 0)
                 source_roi_formatted = f"{source_roi_value:.1f}%" if source_roi_value is not None else ""
@@ -790,14 +865,13 @@ def generate_lead_source_answer(question: str, analysis_results: Dict[str, Any])
                 
                 return f"Your most profitable lead source is {source_name} with {source_profit} in total profit from {source_count} sales."
     
-    if re.search(r'compare|comparison', question):
+    if flags & _Q_COMPARE:
         source_metrics = analysis_results.get("source_metrics", [])
         if source_metrics and len(source_metrics) >= 3:
-            top_sources = source_metrics[:3]
-            source_names = [source.get("name", "") for source in top_sources]
-            source_profits = [format_currency(source.get("total_profit", 0)) for source in top_sources]
-            
-            return f"Your top 3 lead sources by profit are: 1. {source_names[0]} with {source_profits[0]}, 2. {source_names[1]} with {source_profits[1]}, and 3. {source_names[2]} with {source_profits[2]}."
+            return _TOP3_ANSWER.format("lead sources", *chain.from_iterable(
+                (source.get("name", ""), format_currency(source.get("total_profit", 0)))
+                for source in source_metrics[:3]
+            ))
     
     # Default answer
     return f"Your dealership uses {total_sources} different lead sources. I've provided detailed performance insights for your lead sources below."
@@ -819,8 +893,9 @@ def generate_vehicle_answer(question: str, analysis_results: Dict[str, Any]) ->
     avg_days_formatted = f"{avg_days:.1f}" if avg_days is not None else ""
     
     # Check for specific question patterns
-    if re.search(r'highest|top|best|most', question):
-        if re.search(r'make|brand', question):
+    flags = _question_flags(question)
+    if flags & _Q_TOP:
+        if flags & _Q_MAKE:
             # Question about top make
             top_make = summary.get("top_make", {})
             if top_make:
@@ -830,7 +905,7 @@ def generate_vehicle_answer(question: str, analysis_results: Dict[str, Any]) ->
                 
                 return f"Your most profitable vehicle make is {make_name} with {make_profit} in total profit from {make_count} sales."
         
-        if re.search(r'model', question):
+        if flags & _Q_MODEL:
             # Question about top model
             top_model = summary.get("top_model", {})
             if top_model:
@@ -840,12 +915,10 @@ def generate_vehicle_answer(question: str, analysis_results: Dict[str, Any]) ->
                 
                 return f"Your most profitable vehicle model is the {model_name} with {model_profit} in total profit from {model_count} sales."
     
-    if re.search(r'fast|quick|days', question):
+    if flags & _Q_SPEED:
         # Question about fastest selling vehicles
-        vehicle_metrics = analysis_results.get("vehicle_metrics", [])
-        if vehicle_metrics and len(vehicle_metrics) > 0:
-            # Find vehicle with fastest sales
-            fastest_selling = min(vehicle_metrics, key=lambda x: x.get("average_days_to_sell", float('inf')), default={})
+        fastest_selling = analysis_results.get("fastest_vehicle") or {}
+        if fastest_selling:
             if "average_days_to_sell" in fastest_selling:
                 vehicle_type = fastest_selling.get("type", "")
                 days_to_sell = fastest_selling.get("average_days_to_sell", 0)
@@ -873,12 +946,21 @@ def generate_general_answer(question: str, analysis_results: Dict[str, Any]) ->
     average_profit = format_currency(summary.get("average_profit", 0))
     
     # Check for specific question patterns
-    if re.search(r'summary|overview', question):
+    flags = _question_flags(question)
+    if flags & _Q_SUMMARY:
         return f"Your dealership generated {total_sales} in sales and {total_profit} in profit. The average profit per sale is {average_profit}. I've provided detailed insights below."
     
     # Default answer
     return f"Based on your data, I've analyzed your dealership's performance and provided key insights below. Your dealership generated {total_profit} in total profit with an average of {average_profit} per sale."
 
+_ANSWER_DISPATCH: Dict[str, Callable[[str, Dict[str, Any]], str]] = {
+    "sales_analysis": generate_sales_answer,
+    "profit_analysis": generate_profit_answer,
+    "rep_performance": generate_rep_answer,
+    "lead_source_analysis": generate_lead_source_answer,
+    "vehicle_analysis": generate_vehicle_answer,
+}
+
 def generate_action_items_for_metric(title: str, value: str, metric_value: str) -> List[str]:
     """
     Generate action items for a metric.
@@ -916,6 +998,9 @@ def format_currency(value: float) -> str:
     """
     Format a value as currency.
     
+    Numbers are formatted through a memoized helper; the same totals and the
+    0 defaults are formatted many times per request.
+    
     Args:
         value: Value to format
         
@@ -925,9 +1010,18 @@ def format_currency(value: float) -> str:
     if value is None:
         return "$0"
     
+    # Only plain numbers are cached (other values may be unhashable)
+    if isinstance(value, (int, float)):
+        return _format_currency_amount(value)
+    
     try:
         # Format with commas and dollar sign
-        return "${:,.2f}".format(value)
+        return f"${value:,.2f}"
     except:
         # Return as is if formatting fails
         return str(value)
+
+@lru_cache(maxsize=4096)
+def _format_currency_amount(value: float) -> str:
+    """Format a number as currency with commas and a dollar sign."""
+    return f"${value:,.2f}"
@@ -1,35 +1,27 @@
 import pytest
 from fastapi.testclient import TestClient
 import pandas as pd
-import os
-import tempfile
 from app.main import app
 
 client = TestClient(app)
 
 @pytest.fixture
 def sample_csv_file():
-    """Create a sample CSV file for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as temp:
-        # Create a simple dataframe
-        df = pd.DataFrame({
-            'sales_rep_name': ['John Doe', 'Jane Smith', 'John Doe', 'Jane Smith'],
-            'lead_source': ['Website', 'Referral', 'Website', 'Walk-in'],
-            'vehicle_make': ['Honda', 'Toyota', 'Honda', 'Ford'],
-            'vehicle_model': ['Civic', 'Camry', 'Accord', 'F-150'],
-            'listing_price': [25000, 28000, 27000, 35000],
-            'sold_price': [23500, 26800, 25500, 33000],
-            'profit': [2000, 2500, 1800, 3000],
-            'sale_date': ['2025-01-15', '2025-01-20', '2025-02-05', '2025-02-10']
-        })
-        
-        # Save to CSV
-        df.to_csv(temp.name, index=False)
-        
-        yield temp.name
+    """Create the contents of a sample CSV file for testing."""
+    # Create a simple dataframe
+    df = pd.DataFrame({
+        'sales_rep_name': ['John Doe', 'Jane Smith', 'John Doe', 'Jane Smith'],
+        'lead_source': ['Website', 'Referral', 'Website', 'Walk-in'],
+        'vehicle_make': ['Honda', 'Toyota', 'Honda', 'Ford'],
+        'vehicle_model': ['Civic', 'Camry', 'Accord', 'F-150'],
+        'listing_price': [25000, 28000, 27000, 35000],
+        'sold_price': [23500, 26800, 25500, 33000],
+        'profit': [2000, 2500, 1800, 3000],
+        'sale_date': ['2025-01-15', '2025-01-20', '2025-02-05', '2025-02-10']
+    })
     
-    # Clean up
-    os.unlink(temp.name)
+    # Render as CSV in memory
+    return df.to_csv(index=False).encode()
 
 def test_root_endpoint():
     """Test the root endpoint returns correct information."""
@@ -40,11 +32,10 @@ def test_root_endpoint():
 
 def test_upload_endpoint(sample_csv_file):
     """Test the file upload endpoint."""
-    with open(sample_csv_file, 'rb') as f:
-        response = client.post(
-            "/v1/upload",
-            files={"file": ("test.csv", f, "text/csv")}
-        )
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.csv", sample_csv_file, "text/csv")}
+    )
     
     assert response.status_code == 200
     assert "upload_id" in response.json()
@@ -55,11 +46,10 @@ def test_upload_endpoint(sample_csv_file):
 def test_analyze_endpoint(sample_csv_file):
     """Test the analyze endpoint."""
     # First upload a file
-    with open(sample_csv_file, 'rb') as f:
-        upload_response = client.post(
-            "/v1/upload",
-            files={"file": ("test.csv", f, "text/csv")}
-        )
+    upload_response = client.post(
+        "/v1/upload",
+        files={"file": ("test.csv", sample_csv_file, "text/csv")}
+    )
     
     upload_id = upload_response.json()["upload_id"]
     
@@ -76,11 +66,10 @@ def test_analyze_endpoint(sample_csv_file):
 def test_question_endpoint(sample_csv_file):
     """Test the question endpoint."""
     # First upload a file
-    with open(sample_csv_file, 'rb') as f:
-        upload_response = client.post(
-            "/v1/upload",
-            files={"file": ("test.csv", f, "text/csv")}
-        )
+    upload_response = client.post(
+        "/v1/upload",
+        files={"file": ("test.csv", sample_csv_file, "text/csv")}
+    )
     
     upload_id = upload_response.json()["upload_id"]
     
@@ -97,21 +86,36 @@ def test_question_endpoint(sample_csv_file):
 
 def test_invalid_file_upload():
     """Test uploading an invalid file type."""
-    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp:
-        temp.write(b"This is not a CSV file")
-        temp.flush()
-        
-        with open(temp.name, 'rb') as f:
-            response = client.post(
-                "/v1/upload",
-                files={"file": ("test.txt", f, "text/plain")}
-            )
-        
-        assert response.status_code == 400
-        assert "Only CSV files are supported" in response.json()["detail"]
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.txt", b"This is not a CSV file", "text/plain")}
+    )
+    
+    assert response.status_code == 400
+    assert "Only CSV files are supported" in response.json()["detail"]
+
+def test_mixed_case_extension_upload(sample_csv_file):
+    """Test that the CSV extension check ignores case."""
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.Csv", sample_csv_file, "text/csv")}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["filename"] == "test.Csv"
+
+def test_oversized_file_upload(sample_csv_file, monkeypatch):
+    """Test uploading a file larger than the configured limit."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 64)
+    
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.csv", sample_csv_file, "text/csv")}
+    )
     
-    # Clean up
-    os.unlink(temp.name)
+    assert response.status_code == 413
+    assert "maximum upload size" in response.json()["detail"]
 
 def test_nonexistent_upload_id():
     """Test accessing a non-existent upload ID."""